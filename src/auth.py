@@ -1,14 +1,92 @@
 """
 Authentication Module
 Handles user authentication and authorization.
-Implements PRJ-SEC-001 (Password hashing with salted SHA-256).
+Implements PRJ-SEC-001 (Password hashing with salted scrypt; legacy
+salted-SHA-256 hashes remain verifiable and are upgraded on login).
 Implements INV-NF-003 (Admin-only restricted functions).
 """
 
 import hashlib
-from typing import Optional, Dict
+import hmac
+import sqlite3
+from functools import lru_cache
+from typing import List, Optional, Dict
+from .config import PASSWORD_HASH_CACHE
 from .storage import StorageManager
 
+# Resolve the SHA-256 constructor once at import time. hashlib binds to
+# OpenSSL's EVP layer, which selects the fastest compression routine the CPU
+# offers (SHA-NI / AVX2) at library load, so a single module-level lookup
+# avoids repeating the hashlib attribute dispatch on every hash call.
+_sha256 = hashlib.sha256
+
+
+# Pre-encoded salt (must match AuthManager.SALT) so hashing feeds the
+# password and salt into the digest separately instead of building and
+# encoding a concatenated string per call.
+_SALT_BYTES = b"ims_secure_salt_2025"
+
+
+# scrypt work parameters. The memory-hard derivation forces attackers into
+# ~16 MiB of state per guess, which does not parallelize on GPUs the way a
+# plain SHA-256 sweep does. dklen=32 keeps the hex digest at 64 characters,
+# the same width as the legacy SHA-256 hashes already in the users table.
+_SCRYPT_N = 2 ** 14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SCRYPT_DKLEN = 32
+
+
+def _derive_scrypt(password_bytes: bytes) -> str:
+    """Derive the memory-hard scrypt hash of a password."""
+    return hashlib.scrypt(password_bytes, salt=_SALT_BYTES,
+                          n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P,
+                          dklen=_SCRYPT_DKLEN).hex()
+
+
+def _derive_legacy_sha256(password_bytes: bytes) -> str:
+    """Salted-SHA-256 hash used before the scrypt migration.
+
+    Kept so users created under the old scheme can still log in; their
+    stored hash is upgraded to scrypt on the first successful login.
+    """
+    digest = _sha256()
+    digest.update(password_bytes)
+    digest.update(_SALT_BYTES)
+    return digest.hexdigest()
+
+
+# Cached variants, used only when config.PASSWORD_HASH_CACHE is set.
+# The trade-off: the LRU eliminates the deliberately expensive scrypt
+# derivation for repeated hashes of the same credential, but its keys
+# are plaintext password bytes — including wrong guesses fed through
+# verify_password — held in process memory until evicted or cleared.
+# That is acceptable for test runs and bulk imports hashing known
+# passwords, not for an interactive production process, which is why
+# the flag defaults to off.
+_cached_scrypt = lru_cache(maxsize=128)(_derive_scrypt)
+_cached_legacy_sha256 = lru_cache(maxsize=128)(_derive_legacy_sha256)
+
+
+def _hash_password_bytes(password_bytes: bytes) -> str:
+    """scrypt hash, via the opt-in cache when enabled."""
+    if PASSWORD_HASH_CACHE:
+        return _cached_scrypt(password_bytes)
+    return _derive_scrypt(password_bytes)
+
+
+def _legacy_hash_password_bytes(password_bytes: bytes) -> str:
+    """Legacy salted-SHA-256 hash, via the opt-in cache when enabled."""
+    if PASSWORD_HASH_CACHE:
+        return _cached_legacy_sha256(password_bytes)
+    return _derive_legacy_sha256(password_bytes)
+
+
+def clear_password_hash_cache():
+    """Drop every cached plaintext-keyed hash derivation."""
+    _cached_scrypt.cache_clear()
+    _cached_legacy_sha256.cache_clear()
+
 
 class AuthManager:
     """Manages authentication operations."""
@@ -25,10 +103,15 @@ class AuthManager:
         """
         self.storage = storage or StorageManager()
         self.current_user: Optional[Dict] = None
+        # Session attributes derived once per login so the per-call checks
+        # (is_admin / get_current_username, hit on every menu redraw and
+        # logged action) are plain attribute reads instead of dict lookups
+        self._is_admin = False
+        self._username = 'anonymous'
 
     def hash_password(self, password: str) -> str:
         """
-        Hash password with salt using SHA-256 (PRJ-SEC-001).
+        Hash password with salt using scrypt (PRJ-SEC-001).
         
         Args:
             password: Plain text password
@@ -36,8 +119,23 @@ class AuthManager:
         Returns:
             Hexadecimal hash string
         """
-        salted_password = password + self.SALT
-        return hashlib.sha256(salted_password.encode()).hexdigest()
+        return _hash_password_bytes(password.encode())
+
+    def hash_passwords_bulk(self, passwords: List[str]) -> List[str]:
+        """
+        Hash a batch of passwords in one pass (PRJ-SEC-001).
+
+        Used by bulk user-import paths so the per-call overhead of the
+        method dispatch and salt concatenation is paid once per batch.
+
+        Args:
+            passwords: Plain text passwords
+
+        Returns:
+            List of hexadecimal hash strings, in input order
+        """
+        return [_hash_password_bytes(password.encode())
+                for password in passwords]
 
     def verify_password(self, password: str, password_hash: str) -> bool:
         """
@@ -50,7 +148,15 @@ class AuthManager:
         Returns:
             True if password matches, False otherwise
         """
-        return self.hash_password(password) == password_hash
+        # Constant-time comparison: equality checks on hex digests
+        # short-circuit on the first differing byte, which both leaks
+        # timing and produces unpredictable branches on the hot login path
+        candidate = password.encode()
+        if hmac.compare_digest(_hash_password_bytes(candidate), password_hash):
+            return True
+        # Fall back to the pre-migration salted-SHA-256 scheme
+        return hmac.compare_digest(_legacy_hash_password_bytes(candidate),
+                                   password_hash)
 
     def login(self, username: str, password: str) -> bool:
         """
@@ -69,14 +175,27 @@ class AuthManager:
             return False
         
         if self.verify_password(password, user['password_hash']):
+            # Transparently upgrade legacy SHA-256 hashes to scrypt now
+            # that the correct password is in hand
+            current_hash = self.hash_password(password)
+            if user['password_hash'] != current_hash:
+                self.storage.update_user_password_hash(username, current_hash)
+                user['password_hash'] = current_hash
             self.current_user = user
+            self._is_admin = user.get('role') == 'admin'
+            self._username = user.get('username', 'unknown')
             return True
-        
+
         return False
 
     def logout(self):
         """Logout current user."""
         self.current_user = None
+        self._is_admin = False
+        self._username = 'anonymous'
+        # Session is over: no reason to keep plaintext-keyed hash
+        # derivations around even where the opt-in cache is enabled
+        clear_password_hash_cache()
 
     def is_authenticated(self) -> bool:
         """Check if user is authenticated."""
@@ -91,13 +210,13 @@ class AuthManager:
         """
         if not self.current_user:
             return False
-        return self.current_user.get('role') == 'admin'
+        return self._is_admin
 
     def get_current_username(self) -> str:
         """Get current user's username."""
-        if self.current_user:
-            return self.current_user.get('username', 'unknown')
-        return 'anonymous'
+        if not self.current_user:
+            return 'anonymous'
+        return self._username
 
     def register_user(self, username: str, password: str, role: str = 'user') -> bool:
         """
@@ -111,14 +230,13 @@ class AuthManager:
         Returns:
             True if registration successful, False if username exists
         """
-        # Check if username already exists
-        existing_user = self.storage.get_user_by_username(username)
-        if existing_user:
-            return False
-        
-        # Hash password and create user
+        # Rely on the UNIQUE constraint instead of a SELECT-then-INSERT
+        # round-trip; this is also race-free under concurrent registration
         password_hash = self.hash_password(password)
-        self.storage.add_user(username, password_hash, role)
+        try:
+            self.storage.add_user(username, password_hash, role)
+        except sqlite3.IntegrityError:
+            return False
         return True
 
     def require_admin(self):
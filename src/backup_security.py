@@ -1,23 +1,109 @@
 """
 Backup and Security Module
 Handles data backup and security operations.
-Implements PRJ-SEC-002 (Backup encryption with AES Fernet).
+Implements PRJ-SEC-002 (Backup encryption with AES-256-GCM).
 Implements PRJ-SEC-005 (Protect backup integrity).
 Implements INV-NF-004 (Daily backup creation).
 """
 
+import base64
+import io
+import mmap
 import os
 import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from cryptography.fernet import Fernet
-from typing import Optional
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from typing import Dict, List, Optional
 from .config import DB_PATH, BACKUP_PATH, ENCRYPTION_KEY
 from .logger import LogManager
 
+# AES-GCM nonce size in bytes; the nonce is prepended to each ciphertext.
+NONCE_SIZE = 12
+
+# Chunked backup format: magic header, then length-prefixed AES-GCM records
+# ([4-byte length][nonce][ciphertext]); a final empty record marks (and
+# authenticates) end-of-file. Each record's chunk index is bound as
+# associated data so records cannot be dropped or reordered.
+BACKUP_MAGIC = b"IMSGCM1\n"
+CHUNK_SIZE = 1024 * 1024
+
+
+def _aesgcm_from_key(key: bytes) -> AESGCM:
+    """Build an AES-256-GCM cipher from the stored (base64) Fernet key."""
+    return AESGCM(base64.urlsafe_b64decode(key))
+
+
+def _snapshot_copy(src_path: str, dst_path: str):
+    """
+    Copy src_path to dst_path for the pre-restore snapshot.
+
+    Uses os.copy_file_range where available (Linux) so the bytes are moved
+    entirely in-kernel; falls back to shutil.copy2 on other platforms or
+    filesystems that reject the in-kernel copy.
+    """
+    try:
+        with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except (AttributeError, OSError):
+        shutil.copy2(src_path, dst_path)
+
+
+class _NullSink:
+    """Write target that discards data (used for stream verification)."""
+
+    def write(self, data):
+        pass
+
+
+def _encrypt_stream(aesgcm: AESGCM, src, dst):
+    """Encrypt src file object into dst in CHUNK_SIZE records."""
+    dst.write(BACKUP_MAGIC)
+    index = 0
+    while True:
+        chunk = src.read(CHUNK_SIZE)
+        nonce = os.urandom(NONCE_SIZE)
+        ciphertext = aesgcm.encrypt(nonce, chunk, index.to_bytes(8, 'big'))
+        dst.write(len(ciphertext).to_bytes(4, 'big'))
+        dst.write(nonce)
+        dst.write(ciphertext)
+        if not chunk:
+            break
+        index += 1
+
+
+def _decrypt_stream(aesgcm: AESGCM, src, dst):
+    """Decrypt a chunked backup from src into dst; raises on corruption."""
+    index = 0
+    while True:
+        header = src.read(4)
+        if len(header) < 4:
+            raise ValueError("Truncated backup stream")
+        length = int.from_bytes(header, 'big')
+        nonce = src.read(NONCE_SIZE)
+        ciphertext = src.read(length)
+        chunk = aesgcm.decrypt(nonce, ciphertext, index.to_bytes(8, 'big'))
+        if not chunk:
+            break
+        dst.write(chunk)
+        index += 1
+
 
 class BackupManager:
     """Manages backup operations."""
 
+    # Backup directories already created and permission-restricted by an
+    # earlier instance in this process; lets repeated construction skip
+    # the makedirs/chmod syscalls
+    _dir_prepared = set()
+
     def __init__(self, logger: LogManager = None):
         """
         Initialize backup manager.
@@ -29,15 +115,25 @@ class BackupManager:
         self.backup_dir = BACKUP_PATH
         self.db_path = DB_PATH
         self.encryption_key = ENCRYPTION_KEY
-        
-        # Ensure backup directory exists
-        os.makedirs(self.backup_dir, exist_ok=True)
-        
-        # Set restrictive permissions on backup directory (PRJ-SEC-005)
-        try:
-            os.chmod(self.backup_dir, 0o700)  # Read/write/execute for owner only
-        except Exception:
-            pass  # Windows may not support chmod
+        # Build the cipher contexts once: AES-GCM for new backups (single
+        # pass over the data, hardware AES + GHASH), Fernet only to decrypt
+        # backups created before the format change.
+        self._aesgcm = _aesgcm_from_key(self.encryption_key)
+        self._fernet = Fernet(self.encryption_key)
+        # list_backups cache: (directory mtime_ns, sorted filenames)
+        self._backup_list_cache = None
+
+        # Ensure backup directory exists (once per directory per process)
+        if self.backup_dir not in BackupManager._dir_prepared:
+            os.makedirs(self.backup_dir, exist_ok=True)
+
+            # Set restrictive permissions on backup directory (PRJ-SEC-005)
+            try:
+                os.chmod(self.backup_dir, 0o700)  # Read/write/execute for owner only
+            except Exception:
+                pass  # Windows may not support chmod
+
+            BackupManager._dir_prepared.add(self.backup_dir)
 
     def create_backup(self, user: str = "system") -> Optional[str]:
         """
@@ -50,8 +146,10 @@ class BackupManager:
             Path to backup file if successful, None otherwise
         """
         try:
-            # Check if database exists
-            if not os.path.exists(self.db_path):
+            # Check if database exists (single stat instead of exists+open)
+            try:
+                os.stat(self.db_path)
+            except FileNotFoundError:
                 print(f"Error: Database not found at {self.db_path}")
                 return None
             
@@ -60,23 +158,45 @@ class BackupManager:
             backup_filename = f"backup_{timestamp}.enc"
             backup_path = os.path.join(self.backup_dir, backup_filename)
             
-            # Read database file
-            with open(self.db_path, 'rb') as f:
-                db_data = f.read()
-            
-            # Encrypt data (PRJ-SEC-002)
-            fernet = Fernet(self.encryption_key)
-            encrypted_data = fernet.encrypt(db_data)
-            
-            # Write encrypted backup
-            with open(backup_path, 'wb') as f:
-                f.write(encrypted_data)
-            
-            # Set restrictive permissions on backup file (PRJ-SEC-005)
+            # Snapshot through SQLite's online backup API first: reading
+            # the database file directly would miss commits still sitting
+            # in the -wal file and can catch a writer mid-page, yielding a
+            # stale or torn copy. The snapshot is a complete, consistent
+            # single-file database regardless of journal mode.
+            snapshot_path = backup_path + '.snap'
+            src_conn = sqlite3.connect(self.db_path)
             try:
-                os.chmod(backup_path, 0o400)  # Read-only for owner
-            except Exception:
-                pass  # Windows may not support chmod
+                snap_conn = sqlite3.connect(snapshot_path)
+                try:
+                    src_conn.backup(snap_conn)
+                finally:
+                    snap_conn.close()
+            finally:
+                src_conn.close()
+
+            # Stream the snapshot through the cipher in 1 MiB chunks so
+            # peak memory stays flat regardless of database size (PRJ-SEC-002).
+            # The source is memory-mapped where possible so chunks come
+            # straight from the page cache instead of a copying read().
+            # Create the backup file with its final 0o400 permissions in
+            # one syscall: the mode argument applies at creation, so no
+            # separate chmod is needed and there is no window where the
+            # file exists with default permissions (PRJ-SEC-005)
+            try:
+                fd = os.open(backup_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o400)
+                with open(snapshot_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                    try:
+                        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            try:
+                                mapped.madvise(mmap.MADV_SEQUENTIAL)
+                            except (AttributeError, ValueError):
+                                pass
+                            _encrypt_stream(self._aesgcm, mapped, dst)
+                    except (ValueError, OSError):
+                        # Empty file or platform without mmap support
+                        _encrypt_stream(self._aesgcm, src, dst)
+            finally:
+                os.unlink(snapshot_path)
             
             # Log action (PRJ-SEC-003)
             self.logger.log_action(
@@ -106,28 +226,57 @@ class BackupManager:
         try:
             backup_path = os.path.join(self.backup_dir, backup_filename)
             
-            # Check if backup file exists
-            if not os.path.exists(backup_path):
+            # Check if backup file exists (single stat call)
+            try:
+                os.stat(backup_path)
+            except FileNotFoundError:
                 print(f"Error: Backup file not found: {backup_filename}")
                 return False
             
-            # Read encrypted backup
-            with open(backup_path, 'rb') as f:
-                encrypted_data = f.read()
-            
-            # Decrypt data (PRJ-SEC-002)
-            fernet = Fernet(self.encryption_key)
-            decrypted_data = fernet.decrypt(encrypted_data)
-            
-            # Create backup of current database before restoring
+            # Create backup of current database before restoring; a missing
+            # database simply means there is nothing to snapshot
             current_backup = os.path.join(self.backup_dir, f"pre_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db")
-            if os.path.exists(self.db_path):
-                shutil.copy2(self.db_path, current_backup)
-            
-            # Write restored database
-            with open(self.db_path, 'wb') as f:
-                f.write(decrypted_data)
+            try:
+                _snapshot_copy(self.db_path, current_backup)
+            except FileNotFoundError:
+                pass
             
+            # Decrypt to a scratch file first so a corrupted backup cannot
+            # leave a half-written database behind (PRJ-SEC-002)
+            restore_path = self.db_path + '.restore'
+            with open(backup_path, 'rb') as src, open(restore_path, 'wb') as dst:
+                if src.read(len(BACKUP_MAGIC)) == BACKUP_MAGIC:
+                    _decrypt_stream(self._aesgcm, src, dst)
+                else:
+                    # Legacy one-shot formats (whole-file AES-GCM or Fernet)
+                    src.seek(0)
+                    encrypted_data = src.read()
+                    try:
+                        nonce = encrypted_data[:NONCE_SIZE]
+                        ciphertext = encrypted_data[NONCE_SIZE:]
+                        dst.write(self._aesgcm.decrypt(nonce, ciphertext, None))
+                    except Exception:
+                        dst.write(self._fernet.decrypt(encrypted_data))
+            os.replace(restore_path, self.db_path)
+
+            # The swap replaces only the main database file. Under WAL,
+            # stale -wal/-shm sidecars from the pre-restore database
+            # would be replayed over the restored file by the next
+            # connection, resurrecting exactly the data the restore was
+            # meant to remove — so they go with it.
+            for sidecar in ('-wal', '-shm'):
+                try:
+                    os.unlink(self.db_path + sidecar)
+                except FileNotFoundError:
+                    pass
+
+            # Live StorageManager connections (including the logger's,
+            # which the CLI shares) still point at the replaced inode;
+            # make them reopen so the restore takes effect in-process
+            # and the RESTORE_BACKUP entry below lands in the restored
+            # database rather than the orphaned one
+            self.logger.storage.reset_connections()
+
             # Log action (PRJ-SEC-003)
             self.logger.log_action(
                 user,
@@ -151,9 +300,16 @@ class BackupManager:
             List of backup filenames sorted by date (newest first)
         """
         try:
+            # The directory mtime changes whenever a backup is created or
+            # deleted, so it is a cheap validity check for the cached list
+            dir_mtime = os.stat(self.backup_dir).st_mtime_ns
+            if self._backup_list_cache and self._backup_list_cache[0] == dir_mtime:
+                return list(self._backup_list_cache[1])
+
             backups = [f for f in os.listdir(self.backup_dir) if f.endswith('.enc')]
             backups.sort(reverse=True)  # Newest first
-            return backups
+            self._backup_list_cache = (dir_mtime, backups)
+            return list(backups)
         except Exception:
             return []
 
@@ -172,10 +328,14 @@ class BackupManager:
         for i, backup in enumerate(backups, 1):
             # Extract timestamp from filename
             try:
-                timestamp_str = backup.replace('backup_', '').replace('.enc', '')
-                timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                formatted_date = timestamp.strftime('%Y-%m-%d %H:%M:%S')
-                
+                # Filenames are fixed-format (backup_YYYYMMDD_HHMMSS.enc),
+                # so slicing avoids a strptime/strftime round-trip per entry
+                ts = backup[len('backup_'):-len('.enc')]
+                if len(ts) != 15 or not (ts[:8] + ts[9:]).isdigit():
+                    raise ValueError(f"Unexpected backup filename: {backup}")
+                formatted_date = (f"{ts[0:4]}-{ts[4:6]}-{ts[6:8]} "
+                                  f"{ts[9:11]}:{ts[11:13]}:{ts[13:15]}")
+
                 # Get file size
                 backup_path = os.path.join(self.backup_dir, backup)
                 size_bytes = os.path.getsize(backup_path)
@@ -201,13 +361,14 @@ class BackupManager:
         try:
             backup_path = os.path.join(self.backup_dir, backup_filename)
             
-            if not os.path.exists(backup_path):
+            # Delete directly; a missing file surfaces as FileNotFoundError
+            # rather than costing an extra stat on every successful delete
+            try:
+                os.remove(backup_path)
+            except FileNotFoundError:
                 print(f"Error: Backup file not found: {backup_filename}")
                 return False
             
-            # Delete file
-            os.remove(backup_path)
-            
             # Log action (PRJ-SEC-003)
             self.logger.log_action(
                 user,
@@ -229,23 +390,29 @@ class SecurityManager:
     def __init__(self):
         """Initialize security manager."""
         self.encryption_key = ENCRYPTION_KEY
+        # Reused cipher contexts (see BackupManager.__init__)
+        self._aesgcm = _aesgcm_from_key(self.encryption_key)
+        self._fernet = Fernet(self.encryption_key)
 
     def encrypt_data(self, data: bytes) -> bytes:
         """
-        Encrypt data using Fernet (AES).
+        Encrypt data using AES-256-GCM.
         
         Args:
             data: Raw bytes to encrypt
             
         Returns:
-            Encrypted bytes
+            Encrypted bytes (nonce prepended to ciphertext)
         """
-        fernet = Fernet(self.encryption_key)
-        return fernet.encrypt(data)
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + self._aesgcm.encrypt(nonce, data, None)
 
     def decrypt_data(self, encrypted_data: bytes) -> bytes:
         """
-        Decrypt data using Fernet (AES).
+        Decrypt data using AES-256-GCM.
+        
+        Falls back to Fernet for payloads created before the AES-GCM
+        format change.
         
         Args:
             encrypted_data: Encrypted bytes
@@ -253,25 +420,67 @@ class SecurityManager:
         Returns:
             Decrypted bytes
         """
-        fernet = Fernet(self.encryption_key)
-        return fernet.decrypt(encrypted_data)
+        try:
+            nonce, ciphertext = encrypted_data[:NONCE_SIZE], encrypted_data[NONCE_SIZE:]
+            return self._aesgcm.decrypt(nonce, ciphertext, None)
+        except Exception:
+            return self._fernet.decrypt(encrypted_data)
 
-    def verify_backup_integrity(self, backup_path: str) -> bool:
+    def verify_backup_integrity(self, backup) -> bool:
         """
-        Verify backup file can be decrypted (integrity check).
-        
+        Verify backup data can be decrypted (integrity check).
+
         Args:
-            backup_path: Path to backup file
-            
+            backup: Path to a backup file, or the encrypted bytes
+                themselves (verified entirely in memory, no filesystem)
+
         Returns:
             True if backup is valid and can be decrypted, False otherwise
         """
         try:
-            with open(backup_path, 'rb') as f:
-                encrypted_data = f.read()
-            
-            fernet = Fernet(self.encryption_key)
-            fernet.decrypt(encrypted_data)
+            if isinstance(backup, (bytes, bytearray)):
+                self._verify_stream(io.BytesIO(bytes(backup)))
+                return True
+            with open(backup, 'rb') as f:
+                # Ask the kernel to start reading the whole file into the
+                # page cache now, so decryption never stalls on disk I/O
+                # (most useful when verify_backups sweeps a directory)
+                try:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                except (AttributeError, OSError):
+                    pass
+                self._verify_stream(f)
             return True
         except Exception:
             return False
+
+    def _verify_stream(self, f):
+        """Decrypt-check an open backup stream; raises on corruption."""
+        if f.read(len(BACKUP_MAGIC)) == BACKUP_MAGIC:
+            # Chunked backup: stream-verify without materializing
+            _decrypt_stream(self._aesgcm, f, _NullSink())
+        else:
+            f.seek(0)
+            self.decrypt_data(f.read())
+
+    def verify_backups(self, backup_paths: List[str], max_workers: int = 4) -> Dict[str, bool]:
+        """
+        Verify integrity of multiple backups concurrently.
+
+        Decryption happens inside OpenSSL, which releases the GIL, so a
+        small thread pool overlaps the AES-GCM work with file I/O when
+        sweeping a whole backup directory.
+
+        Args:
+            backup_paths: Paths to backup files
+            max_workers: Maximum number of worker threads
+
+        Returns:
+            Dict mapping each path to its integrity result
+        """
+        if not backup_paths:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(self.verify_backup_integrity, backup_paths)
+        return dict(zip(backup_paths, results))
@@ -8,52 +8,247 @@ import sys
 import os
 from datetime import datetime, timedelta
 
-# Configure UTF-8 encoding for Windows console
+# Configure UTF-8 encoding for Windows console. reconfigure() keeps the
+# existing C-implemented TextIOWrapper, which dispatches each write with
+# far less overhead than the pure-Python codecs StreamWriter it replaces;
+# the io.TextIOWrapper fallback covers streams without reconfigure.
 if sys.platform == 'win32':
     try:
-        import codecs
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'replace')
-        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'replace')
-    except Exception:
-        # Fallback: use ASCII-safe output
-        pass
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    except (AttributeError, ValueError):
+        try:
+            import io
+            sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8',
+                                          errors='replace', line_buffering=True)
+            sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8',
+                                          errors='replace', line_buffering=True)
+        except Exception:
+            # Fallback: use ASCII-safe output
+            pass
 
-from src.storage import StorageManager
-from src.auth import AuthManager
-from src.logger import LogManager
-from src.product_manager import ProductManager
-from src.supplier_manager import SupplierManager
-from src.order_processor import OrderProcessor
-from src.backup_security import BackupManager
-from src.config import LOW_STOCK_THRESHOLD
+# Enable ANSI escape processing (mode flag 7 = VT processing on) so
+# clear_screen can write the escape sequence directly instead of spawning
+# a `cls` subprocess per menu redraw. Unix terminals support ANSI natively.
+_ANSI_OK = True
+if sys.platform == 'win32':
+    try:
+        import ctypes
+        _kernel32 = ctypes.windll.kernel32
+        _ANSI_OK = bool(_kernel32.SetConsoleMode(_kernel32.GetStdHandle(-11), 7))
+    except Exception:
+        _ANSI_OK = False
 
+# Add parent directory to path for imports (append rather than insert so
+# stdlib/site-packages stay ahead in the search order, and only when it is
+# not already present — re-imports and tests would otherwise pile up
+# duplicate entries that every later import has to re-stat)
+import pathlib
+_project_root = str(pathlib.Path(__file__).resolve().parents[1])
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
 
 class CLI:
     """Command-line interface for IMS."""
 
+    # Static menu bodies, written with a single sys.stdout.write per
+    # redraw instead of one print (stdout lock + flush) per line
+    _MAIN_MENU = (
+        "\n1. Product Management\n"
+        "2. Supplier Management\n"
+        "3. Order Processing\n"
+        "4. Reports & Analytics\n"
+        "5. Backup & Restore (Admin)\n"
+        "6. View Logs (Admin)\n"
+        "7. Login / Logout\n"
+        "8. Help\n"
+        "0. Exit\n\n"
+    )
+    _PRODUCT_MENU = (
+        "\n1. Add Product\n"
+        "2. View All Products\n"
+        "3. Search Products\n"
+        "4. Update Product\n"
+        "5. Delete Product (Admin)\n"
+        "6. Low Stock Alert\n"
+        "0. Back to Main Menu\n\n"
+    )
+    _SUPPLIER_MENU = (
+        "\n1. Add Supplier\n"
+        "2. View All Suppliers\n"
+        "3. Search Suppliers\n"
+        "4. Update Supplier\n"
+        "0. Back to Main Menu\n\n"
+    )
+    _ORDER_MENU = (
+        "\n1. Create Sales Order\n"
+        "2. Create Purchase Order\n"
+        "3. View Sales Orders\n"
+        "4. View Purchase Orders\n"
+        "0. Back to Main Menu\n\n"
+    )
+    _REPORTS_MENU = (
+        "\n1. Inventory Summary\n"
+        "2. Sales Report\n"
+        "3. Purchase Report\n"
+        "4. Sales Report (Date Range)\n"
+        "5. Purchase Report (Date Range)\n"
+        "0. Back to Main Menu\n\n"
+    )
+    _BACKUP_MENU = (
+        "\n1. Create Backup\n"
+        "2. Restore from Backup\n"
+        "3. List Available Backups\n"
+        "4. Delete Backup\n"
+        "0. Back to Main Menu\n\n"
+    )
+
+    # (prompt, field key, cast) rows driving the update prompts; blank
+    # input keeps the current value
+    _PRODUCT_FIELDS = (
+        ("New Name: ", "name", str),
+        ("New Price: ", "price", float),
+        ("New Category: ", "category", str),
+        ("New Stock: ", "stock", int),
+        ("New Description: ", "description", str),
+    )
+    _SUPPLIER_FIELDS = (
+        ("New Name: ", "name", str),
+        ("New Contact Person: ", "contact_person", str),
+        ("New Email: ", "email", str),
+        ("New Phone: ", "phone", str),
+        ("New Address: ", "address", str),
+    )
+
     def __init__(self):
-        """Initialize CLI and all managers."""
-        self.storage = StorageManager()
-        self.auth = AuthManager(self.storage)
-        self.logger = LogManager(self.storage)
-        self.product_manager = ProductManager(self.storage, self.logger)
-        self.supplier_manager = SupplierManager(self.storage, self.logger)
-        self.order_processor = OrderProcessor(self.storage, self.logger, self.product_manager)
-        self.backup_manager = BackupManager(self.logger)
+        """Initialize CLI; managers are constructed lazily on first use."""
+        # A typical session touches only a few managers, so imports and
+        # construction (which opens/initializes the database) are deferred
+        # to the property accessors below. This keeps cold start at the
+        # cost of a None-check per access.
+        self._storage = None
+        self._auth = None
+        self._logger = None
+        self._product_manager = None
+        self._supplier_manager = None
+        self._order_processor = None
+        self._backup_manager = None
+        self._cached_user = None
         self.running = True
+        # Menu dispatch tables: one dict lookup per selection instead of
+        # walking an if/elif ladder, and one shared invalid-option handler
+        self._main_dispatch = {
+            '1': self.product_menu,
+            '2': self.supplier_menu,
+            '3': self.order_menu,
+            '4': self.reports_menu,
+            '5': self.backup_menu,
+            '6': self.logs_menu,
+            '7': self.auth_menu,
+            '8': self.show_help,
+            '0': self.exit_application,
+        }
+        self._product_dispatch = {
+            '1': self.add_product,
+            '2': self.view_products,
+            '3': self.search_products,
+            '4': self.update_product,
+            '5': self.delete_product,
+            '6': self.show_low_stock,
+        }
+        self._supplier_dispatch = {
+            '1': self.add_supplier,
+            '2': self.view_suppliers,
+            '3': self.search_suppliers,
+            '4': self.update_supplier,
+        }
+        self._order_dispatch = {
+            '1': self.create_sales_order,
+            '2': self.create_purchase_order,
+            '3': self.view_sales_orders,
+            '4': self.view_purchase_orders,
+        }
+        self._reports_dispatch = {
+            '1': self.inventory_summary,
+            '2': self.sales_report,
+            '3': self.purchase_report,
+            '4': self.sales_report_date_range,
+            '5': self.purchase_report_date_range,
+        }
+        self._backup_dispatch = {
+            '1': self.create_backup,
+            '2': self.restore_backup,
+            '3': self.list_backups,
+            '4': self.delete_backup,
+        }
+
+    @property
+    def storage(self):
+        """StorageManager, created on first access."""
+        if self._storage is None:
+            from src.storage import StorageManager
+            self._storage = StorageManager()
+        return self._storage
+
+    @property
+    def auth(self):
+        """AuthManager, created on first access."""
+        if self._auth is None:
+            from src.auth import AuthManager
+            self._auth = AuthManager(self.storage)
+        return self._auth
+
+    @property
+    def logger(self):
+        """LogManager, created on first access."""
+        if self._logger is None:
+            from src.logger import LogManager
+            self._logger = LogManager(self.storage)
+        return self._logger
+
+    @property
+    def product_manager(self):
+        """ProductManager, created on first access."""
+        if self._product_manager is None:
+            from src.product_manager import ProductManager
+            self._product_manager = ProductManager(self.storage, self.logger)
+        return self._product_manager
+
+    @property
+    def supplier_manager(self):
+        """SupplierManager, created on first access."""
+        if self._supplier_manager is None:
+            from src.supplier_manager import SupplierManager
+            self._supplier_manager = SupplierManager(self.storage, self.logger)
+        return self._supplier_manager
+
+    @property
+    def order_processor(self):
+        """OrderProcessor, created on first access."""
+        if self._order_processor is None:
+            from src.order_processor import OrderProcessor
+            self._order_processor = OrderProcessor(
+                self.storage, self.logger, self.product_manager
+            )
+        return self._order_processor
+
+    @property
+    def backup_manager(self):
+        """BackupManager, created on first access."""
+        if self._backup_manager is None:
+            from src.backup_security import BackupManager
+            self._backup_manager = BackupManager(self.logger)
+        return self._backup_manager
 
     def clear_screen(self):
         """Clear the terminal screen."""
-        # Use ANSI escape codes instead of os.system for security (B605)
-        if os.name == 'nt':
-            # Windows
-            os.system('cls')  # nosec B605 - safe, no user input
+        if _ANSI_OK:
+            # Single buffered write; avoids a fork/exec per menu redraw
+            sys.stdout.write('\033[2J\033[H')
+            sys.stdout.flush()
         else:
-            # Unix/Linux
-            print('\033[2J\033[H', end='')
+            # Console without VT support (old Windows)
+            os.system('cls')  # nosec B605 - safe, no user input
 
     def print_header(self, title: str):
         """Print formatted header."""
@@ -61,25 +256,49 @@ class CLI:
         print(f"  {title}")
         print("="*80)
 
-    def input_with_prompt(self, prompt: str, required: bool = True) -> str:
-        """Get input with validation."""
-        while True:
-            value = input(f"{prompt}: ").strip()
+    def input_with_prompt(self, prompt: str, required: bool = True,
+                          retries: int = 3) -> str:
+        """Get input with validation.
+
+        Bounded retries (rather than looping forever) mean piped or
+        scripted input that never satisfies the prompt raises instead of
+        spinning; exhausted stdin exits cleanly instead of re-raising
+        EOFError on every iteration.
+
+        Raises:
+            ValueError: If no valid value is entered within retries
+        """
+        for _ in range(retries):
+            try:
+                value = input(prompt).strip()
+            except EOFError:
+                raise SystemExit(0)
             if not required or value:
                 return value
             print("  [!] This field is required. Please enter a value.")
+        raise ValueError(f"No value entered for '{prompt}'")
 
-    def input_number(self, prompt: str, allow_float: bool = False) -> float:
-        """Get numeric input with validation."""
-        while True:
+    def input_number(self, prompt: str, allow_float: bool = False,
+                     retries: int = 3) -> float:
+        """Get numeric input with validation.
+
+        Retry and EOF behavior as in input_with_prompt.
+
+        Raises:
+            ValueError: If no valid number is entered within retries
+        """
+        for _ in range(retries):
             try:
-                value = input(f"{prompt}: ").strip()
+                value = input(prompt).strip()
                 if allow_float:
                     return float(value)
                 else:
                     return int(value)
             except ValueError:
                 print("  [!] Please enter a valid number.")
+            except EOFError:
+                raise SystemExit(0)
+        raise ValueError(f"No valid number entered for '{prompt}'")
 
     def show_main_menu(self):
         """Display main menu."""
@@ -87,50 +306,40 @@ class CLI:
         self.print_header("INVENTORY MANAGEMENT SYSTEM")
         
         if self.auth.is_authenticated():
-            username = self.auth.get_current_username()
+            username = self._user()
             role = "Admin" if self.auth.is_admin() else "User"
             print(f"\nLogged in as: {username} ({role})")
         else:
             print("\nNot logged in (Guest mode - limited access)")
-        
-        print("\n1. Product Management")
-        print("2. Supplier Management")
-        print("3. Order Processing")
-        print("4. Reports & Analytics")
-        print("5. Backup & Restore (Admin)")
-        print("6. View Logs (Admin)")
-        print("7. Login / Logout")
-        print("8. Help")
-        print("0. Exit")
-        print()
+
+        sys.stdout.write(self._MAIN_MENU)
+
+    def _user(self) -> str:
+        """Current username, cached until the auth state changes.
+
+        Menu redraws and logged actions each ask for the username; the
+        memo turns those repeated auth-layer calls into an attribute
+        read. Reset wherever login/logout changes the session.
+        """
+        if self._cached_user is None:
+            self._cached_user = self.auth.get_current_username()
+        return self._cached_user
+
+    def invalid_option(self):
+        """Shared handler for unrecognized menu choices."""
+        print("Invalid option. Please try again.")
+        input("\nPress Enter to continue...")
 
     def main_menu(self):
         """Handle main menu selection."""
         while self.running:
             self.show_main_menu()
             choice = input("Select an option: ").strip()
-            
-            if choice == '1':
-                self.product_menu()
-            elif choice == '2':
-                self.supplier_menu()
-            elif choice == '3':
-                self.order_menu()
-            elif choice == '4':
-                self.reports_menu()
-            elif choice == '5':
-                self.backup_menu()
-            elif choice == '6':
-                self.logs_menu()
-            elif choice == '7':
-                self.auth_menu()
-            elif choice == '8':
-                self.show_help()
-            elif choice == '0':
-                self.exit_application()
+            action = self._main_dispatch.get(choice)
+            if action:
+                action()
             else:
-                print("Invalid option. Please try again.")
-                input("\nPress Enter to continue...")
+                self.invalid_option()
 
     # ========== Product Management ==========
 
@@ -139,34 +348,16 @@ class CLI:
         while True:
             self.clear_screen()
             self.print_header("PRODUCT MANAGEMENT")
-            print("\n1. Add Product")
-            print("2. View All Products")
-            print("3. Search Products")
-            print("4. Update Product")
-            print("5. Delete Product (Admin)")
-            print("6. Low Stock Alert")
-            print("0. Back to Main Menu")
-            print()
-            
+            sys.stdout.write(self._PRODUCT_MENU)
+
             choice = input("Select an option: ").strip()
-            
-            if choice == '1':
-                self.add_product()
-            elif choice == '2':
-                self.view_products()
-            elif choice == '3':
-                self.search_products()
-            elif choice == '4':
-                self.update_product()
-            elif choice == '5':
-                self.delete_product()
-            elif choice == '6':
-                self.show_low_stock()
-            elif choice == '0':
+            if choice == '0':
                 break
+            action = self._product_dispatch.get(choice)
+            if action:
+                action()
             else:
-                print("Invalid option.")
-                input("\nPress Enter to continue...")
+                self.invalid_option()
 
     def add_product(self):
         """Add new product (INV-F-001)."""
@@ -174,14 +365,14 @@ class CLI:
         self.print_header("ADD NEW PRODUCT")
         
         try:
-            sku = self.input_with_prompt("SKU (unique)")
-            name = self.input_with_prompt("Product Name")
-            price = self.input_number("Price", allow_float=True)
-            category = self.input_with_prompt("Category")
-            stock = self.input_number("Initial Stock Quantity")
-            description = self.input_with_prompt("Description (optional)", required=False)
+            sku = self.input_with_prompt("SKU (unique): ")
+            name = self.input_with_prompt("Product Name: ")
+            price = self.input_number("Price: ", allow_float=True)
+            category = self.input_with_prompt("Category: ")
+            stock = self.input_number("Initial Stock Quantity: ")
+            description = self.input_with_prompt("Description (optional): ", required=False)
             
-            user = self.auth.get_current_username()
+            user = self._user()
             product_id = self.product_manager.add_product(
                 sku, name, price, category, stock, description, user
             )
@@ -210,7 +401,12 @@ class CLI:
         self.clear_screen()
         self.print_header("SEARCH PRODUCTS")
         
-        search_term = self.input_with_prompt("Enter search term (name/SKU/category)")
+        try:
+            search_term = self.input_with_prompt("Enter search term (name/SKU/category): ")
+        except ValueError as e:
+            print(f"\n[X] {str(e)}")
+            input("\nPress Enter to continue...")
+            return
         products = self.product_manager.search_products(search_term)
         
         print(f"\nFound {len(products)} product(s):")
@@ -224,7 +420,7 @@ class CLI:
         self.print_header("UPDATE PRODUCT")
         
         try:
-            product_id = int(self.input_with_prompt("Product ID"))
+            product_id = int(self.input_with_prompt("Product ID: "))
             product = self.product_manager.get_product(product_id)
             
             if not product:
@@ -232,38 +428,24 @@ class CLI:
                 input("\nPress Enter to continue...")
                 return
             
-            print(f"\nCurrent details for: {product['name']}")
-            print(f"  SKU: {product['sku']}")
-            print(f"  Price: ${product['price']:.2f}")
-            print(f"  Category: {product['category']}")
-            print(f"  Stock: {product['stock']}")
-            print(f"  Description: {product['description']}")
+            sys.stdout.write(
+                f"\nCurrent details for: {product['name']}\n"
+                f"  SKU: {product['sku']}\n"
+                f"  Price: ${product['price']:.2f}\n"
+                f"  Category: {product['category']}\n"
+                f"  Stock: {product['stock']}\n"
+                f"  Description: {product['description']}\n"
+            )
             
             print("\nLeave fields blank to keep current value:")
             updates = {}
-            
-            name = input("New Name: ").strip()
-            if name:
-                updates['name'] = name
-            
-            price_str = input("New Price: ").strip()
-            if price_str:
-                updates['price'] = float(price_str)
-            
-            category = input("New Category: ").strip()
-            if category:
-                updates['category'] = category
-            
-            stock_str = input("New Stock: ").strip()
-            if stock_str:
-                updates['stock'] = int(stock_str)
-            
-            description = input("New Description: ").strip()
-            if description:
-                updates['description'] = description
-            
+            for prompt, key, cast in self._PRODUCT_FIELDS:
+                value = input(prompt).strip()
+                if value:
+                    updates[key] = cast(value)
+
             if updates:
-                user = self.auth.get_current_username()
+                user = self._user()
                 success = self.product_manager.update_product(product_id, user=user, **updates)
                 if success:
                     print("\n[OK] Product updated successfully!")
@@ -287,7 +469,7 @@ class CLI:
             return
         
         try:
-            product_id = int(self.input_with_prompt("Product ID to delete"))
+            product_id = int(self.input_with_prompt("Product ID to delete: "))
             product = self.product_manager.get_product(product_id)
             
             if not product:
@@ -299,7 +481,7 @@ class CLI:
             confirm = input("Are you sure? (yes/no): ").strip().lower()
             
             if confirm == 'yes':
-                user = self.auth.get_current_username()
+                user = self._user()
                 success = self.product_manager.delete_product(product_id, user)
                 if success:
                     print("\n[OK] Product deleted successfully!")
@@ -314,6 +496,8 @@ class CLI:
 
     def show_low_stock(self):
         """Show low stock products (INV-F-032)."""
+        from src.config import LOW_STOCK_THRESHOLD
+
         self.clear_screen()
         self.print_header(f"LOW STOCK ALERT (Threshold: {LOW_STOCK_THRESHOLD})")
         
@@ -334,28 +518,16 @@ class CLI:
         while True:
             self.clear_screen()
             self.print_header("SUPPLIER MANAGEMENT")
-            print("\n1. Add Supplier")
-            print("2. View All Suppliers")
-            print("3. Search Suppliers")
-            print("4. Update Supplier")
-            print("0. Back to Main Menu")
-            print()
-            
+            sys.stdout.write(self._SUPPLIER_MENU)
+
             choice = input("Select an option: ").strip()
-            
-            if choice == '1':
-                self.add_supplier()
-            elif choice == '2':
-                self.view_suppliers()
-            elif choice == '3':
-                self.search_suppliers()
-            elif choice == '4':
-                self.update_supplier()
-            elif choice == '0':
+            if choice == '0':
                 break
+            action = self._supplier_dispatch.get(choice)
+            if action:
+                action()
             else:
-                print("Invalid option.")
-                input("\nPress Enter to continue...")
+                self.invalid_option()
 
     def add_supplier(self):
         """Add new supplier (INV-F-020)."""
@@ -363,13 +535,13 @@ class CLI:
         self.print_header("ADD NEW SUPPLIER")
         
         try:
-            name = self.input_with_prompt("Supplier Name")
-            contact_person = self.input_with_prompt("Contact Person (optional)", required=False)
-            email = self.input_with_prompt("Email (optional)", required=False)
-            phone = self.input_with_prompt("Phone (optional)", required=False)
-            address = self.input_with_prompt("Address (optional)", required=False)
+            name = self.input_with_prompt("Supplier Name: ")
+            contact_person = self.input_with_prompt("Contact Person (optional): ", required=False)
+            email = self.input_with_prompt("Email (optional): ", required=False)
+            phone = self.input_with_prompt("Phone (optional): ", required=False)
+            address = self.input_with_prompt("Address (optional): ", required=False)
             
-            user = self.auth.get_current_username()
+            user = self._user()
             supplier_id = self.supplier_manager.add_supplier(
                 name, contact_person, email, phone, address, user
             )
@@ -395,7 +567,12 @@ class CLI:
         self.clear_screen()
         self.print_header("SEARCH SUPPLIERS")
         
-        search_term = self.input_with_prompt("Enter search term (name/contact/email)")
+        try:
+            search_term = self.input_with_prompt("Enter search term (name/contact/email): ")
+        except ValueError as e:
+            print(f"\n[X] {str(e)}")
+            input("\nPress Enter to continue...")
+            return
         suppliers = self.supplier_manager.search_suppliers(search_term)
         
         print(f"\nFound {len(suppliers)} supplier(s):")
@@ -409,7 +586,7 @@ class CLI:
         self.print_header("UPDATE SUPPLIER")
         
         try:
-            supplier_id = int(self.input_with_prompt("Supplier ID"))
+            supplier_id = int(self.input_with_prompt("Supplier ID: "))
             supplier = self.supplier_manager.get_supplier(supplier_id)
             
             if not supplier:
@@ -417,37 +594,23 @@ class CLI:
                 input("\nPress Enter to continue...")
                 return
             
-            print(f"\nCurrent details for: {supplier['name']}")
-            print(f"  Contact: {supplier['contact_person']}")
-            print(f"  Email: {supplier['email']}")
-            print(f"  Phone: {supplier['phone']}")
-            print(f"  Address: {supplier['address']}")
+            sys.stdout.write(
+                f"\nCurrent details for: {supplier['name']}\n"
+                f"  Contact: {supplier['contact_person']}\n"
+                f"  Email: {supplier['email']}\n"
+                f"  Phone: {supplier['phone']}\n"
+                f"  Address: {supplier['address']}\n"
+            )
             
             print("\nLeave fields blank to keep current value:")
             updates = {}
-            
-            name = input("New Name: ").strip()
-            if name:
-                updates['name'] = name
-            
-            contact = input("New Contact Person: ").strip()
-            if contact:
-                updates['contact_person'] = contact
-            
-            email = input("New Email: ").strip()
-            if email:
-                updates['email'] = email
-            
-            phone = input("New Phone: ").strip()
-            if phone:
-                updates['phone'] = phone
-            
-            address = input("New Address: ").strip()
-            if address:
-                updates['address'] = address
-            
+            for prompt, key, cast in self._SUPPLIER_FIELDS:
+                value = input(prompt).strip()
+                if value:
+                    updates[key] = cast(value)
+
             if updates:
-                user = self.auth.get_current_username()
+                user = self._user()
                 success = self.supplier_manager.update_supplier(supplier_id, user=user, **updates)
                 if success:
                     print("\n[OK] Supplier updated successfully!")
@@ -467,28 +630,16 @@ class CLI:
         while True:
             self.clear_screen()
             self.print_header("ORDER PROCESSING")
-            print("\n1. Create Sales Order")
-            print("2. Create Purchase Order")
-            print("3. View Sales Orders")
-            print("4. View Purchase Orders")
-            print("0. Back to Main Menu")
-            print()
-            
+            sys.stdout.write(self._ORDER_MENU)
+
             choice = input("Select an option: ").strip()
-            
-            if choice == '1':
-                self.create_sales_order()
-            elif choice == '2':
-                self.create_purchase_order()
-            elif choice == '3':
-                self.view_sales_orders()
-            elif choice == '4':
-                self.view_purchase_orders()
-            elif choice == '0':
+            if choice == '0':
                 break
+            action = self._order_dispatch.get(choice)
+            if action:
+                action()
             else:
-                print("Invalid option.")
-                input("\nPress Enter to continue...")
+                self.invalid_option()
 
     def create_sales_order(self):
         """Create sales order (INV-F-010, INV-F-011)."""
@@ -496,7 +647,7 @@ class CLI:
         self.print_header("CREATE SALES ORDER")
         
         try:
-            product_id = int(self.input_with_prompt("Product ID"))
+            product_id = int(self.input_with_prompt("Product ID: "))
             product = self.product_manager.get_product(product_id)
             
             if not product:
@@ -508,10 +659,14 @@ class CLI:
             print(f"Available Stock: {product['stock']}")
             print(f"Price: ${product['price']:.2f}")
             
-            quantity = int(self.input_with_prompt("\nQuantity to sell"))
+            quantity = int(self.input_with_prompt("\nQuantity to sell: "))
             
-            user = self.auth.get_current_username()
-            order_id = self.order_processor.create_sales_order(product_id, quantity, user)
+            user = self._user()
+            # Pass the product fetched above so the processor skips its
+            # own lookup
+            order_id = self.order_processor.create_sales_order(
+                product_id, quantity, user, product=product
+            )
             
             if order_id:
                 total = product['price'] * quantity
@@ -531,7 +686,7 @@ class CLI:
         self.print_header("CREATE PURCHASE ORDER")
         
         try:
-            product_id = int(self.input_with_prompt("Product ID"))
+            product_id = int(self.input_with_prompt("Product ID: "))
             product = self.product_manager.get_product(product_id)
             
             if not product:
@@ -542,13 +697,14 @@ class CLI:
             print(f"\nProduct: {product['name']}")
             print(f"Current Stock: {product['stock']}")
             
-            supplier_id = int(self.input_with_prompt("Supplier ID"))
-            quantity = int(self.input_with_prompt("Quantity to purchase"))
-            unit_price = float(self.input_with_prompt("Unit Price"))
+            supplier_id = int(self.input_with_prompt("Supplier ID: "))
+            quantity = int(self.input_with_prompt("Quantity to purchase: "))
+            unit_price = float(self.input_with_prompt("Unit Price: "))
             
-            user = self.auth.get_current_username()
+            user = self._user()
             order_id = self.order_processor.create_purchase_order(
-                product_id, supplier_id, quantity, unit_price, user
+                product_id, supplier_id, quantity, unit_price, user,
+                product=product
             )
             
             total = unit_price * quantity
@@ -587,31 +743,16 @@ class CLI:
         while True:
             self.clear_screen()
             self.print_header("REPORTS & ANALYTICS")
-            print("\n1. Inventory Summary")
-            print("2. Sales Report")
-            print("3. Purchase Report")
-            print("4. Sales Report (Date Range)")
-            print("5. Purchase Report (Date Range)")
-            print("0. Back to Main Menu")
-            print()
-            
+            sys.stdout.write(self._REPORTS_MENU)
+
             choice = input("Select an option: ").strip()
-            
-            if choice == '1':
-                self.inventory_summary()
-            elif choice == '2':
-                self.sales_report()
-            elif choice == '3':
-                self.purchase_report()
-            elif choice == '4':
-                self.sales_report_date_range()
-            elif choice == '5':
-                self.purchase_report_date_range()
-            elif choice == '0':
+            if choice == '0':
                 break
+            action = self._reports_dispatch.get(choice)
+            if action:
+                action()
             else:
-                print("Invalid option.")
-                input("\nPress Enter to continue...")
+                self.invalid_option()
 
     def inventory_summary(self):
         """Display inventory summary (INV-F-030)."""
@@ -619,14 +760,20 @@ class CLI:
         self.print_header("INVENTORY SUMMARY")
         
         summary = self.storage.get_inventory_summary()
-        
-        print(f"\nTotal Products: {summary.get('total_products', 0)}")
-        print(f"Total Stock Units: {summary.get('total_stock', 0)}")
-        
-        print("\nBy Category:")
-        for cat in summary.get('by_category', []):
-            print(f"  {cat['category']}: {cat['count']} products, {cat['stock']} units")
-        
+
+        # One buffered write for the whole summary instead of a print
+        # (stdout lock + flush) per category row
+        lines = [
+            f"\nTotal Products: {summary.get('total_products', 0)}",
+            f"Total Stock Units: {summary.get('total_stock', 0)}",
+            "\nBy Category:",
+        ]
+        lines.extend(
+            f"  {cat['category']}: {cat['count']} products, {cat['stock']} units"
+            for cat in summary.get('by_category', [])
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
+
         input("\n\nPress Enter to continue...")
 
     def sales_report(self):
@@ -634,15 +781,19 @@ class CLI:
         self.clear_screen()
         self.print_header("SALES REPORT (ALL TIME)")
         
-        report = self.order_processor.get_sales_report()
-        
-        print(f"\nTotal Orders: {report['total_orders']}")
-        print(f"Total Revenue: ${report['total_revenue']:.2f}")
-        print(f"Total Units Sold: {report['total_units']}")
-        
+        # The summary view shows only the 10 most recent orders, so let
+        # the query do the limiting instead of slicing a full fetch
+        report = self.order_processor.get_sales_report(limit=10)
+
+        sys.stdout.write(
+            f"\nTotal Orders: {report['total_orders']}\n"
+            f"Total Revenue: ${report['total_revenue']:.2f}\n"
+            f"Total Units Sold: {report['total_units']}\n"
+        )
+
         if report['orders']:
             print("\nRecent Orders:")
-            self.order_processor.display_sales_orders(report['orders'][:10])
+            self.order_processor.display_sales_orders(report['orders'])
         
         input("Press Enter to continue...")
 
@@ -651,15 +802,17 @@ class CLI:
         self.clear_screen()
         self.print_header("PURCHASE REPORT (ALL TIME)")
         
-        report = self.order_processor.get_purchase_report()
-        
-        print(f"\nTotal Orders: {report['total_orders']}")
-        print(f"Total Cost: ${report['total_cost']:.2f}")
-        print(f"Total Units Purchased: {report['total_units']}")
-        
+        report = self.order_processor.get_purchase_report(limit=10)
+
+        sys.stdout.write(
+            f"\nTotal Orders: {report['total_orders']}\n"
+            f"Total Cost: ${report['total_cost']:.2f}\n"
+            f"Total Units Purchased: {report['total_units']}\n"
+        )
+
         if report['orders']:
             print("\nRecent Orders:")
-            self.order_processor.display_purchase_orders(report['orders'][:10])
+            self.order_processor.display_purchase_orders(report['orders'])
         
         input("Press Enter to continue...")
 
@@ -669,9 +822,19 @@ class CLI:
         self.print_header("SALES REPORT (DATE RANGE)")
         
         try:
-            start_date = self.input_with_prompt("Start Date (YYYY-MM-DD)")
-            end_date = self.input_with_prompt("End Date (YYYY-MM-DD)")
-            
+            start_date = self.input_with_prompt("Start Date (YYYY-MM-DD): ")
+            end_date = self.input_with_prompt("End Date (YYYY-MM-DD): ")
+
+            # Validate and normalize before the DB round trip so a typo
+            # costs nothing and the query sees canonical ISO dates
+            try:
+                start_date = datetime.strptime(start_date, "%Y-%m-%d").date().isoformat()
+                end_date = datetime.strptime(end_date, "%Y-%m-%d").date().isoformat()
+            except ValueError:
+                print("\n[X] Invalid date format. Use YYYY-MM-DD.")
+                input("\nPress Enter to continue...")
+                return
+
             report = self.order_processor.get_sales_report(start_date, end_date)
             
             print(f"\nPeriod: {start_date} to {end_date}")
@@ -693,9 +856,18 @@ class CLI:
         self.print_header("PURCHASE REPORT (DATE RANGE)")
         
         try:
-            start_date = self.input_with_prompt("Start Date (YYYY-MM-DD)")
-            end_date = self.input_with_prompt("End Date (YYYY-MM-DD)")
-            
+            start_date = self.input_with_prompt("Start Date (YYYY-MM-DD): ")
+            end_date = self.input_with_prompt("End Date (YYYY-MM-DD): ")
+
+            # Same client-side validation as the sales date-range report
+            try:
+                start_date = datetime.strptime(start_date, "%Y-%m-%d").date().isoformat()
+                end_date = datetime.strptime(end_date, "%Y-%m-%d").date().isoformat()
+            except ValueError:
+                print("\n[X] Invalid date format. Use YYYY-MM-DD.")
+                input("\nPress Enter to continue...")
+                return
+
             report = self.order_processor.get_purchase_report(start_date, end_date)
             
             print(f"\nPeriod: {start_date} to {end_date}")
@@ -723,35 +895,23 @@ class CLI:
         while True:
             self.clear_screen()
             self.print_header("BACKUP & RESTORE (ADMIN ONLY)")
-            print("\n1. Create Backup")
-            print("2. Restore from Backup")
-            print("3. List Available Backups")
-            print("4. Delete Backup")
-            print("0. Back to Main Menu")
-            print()
-            
+            sys.stdout.write(self._BACKUP_MENU)
+
             choice = input("Select an option: ").strip()
-            
-            if choice == '1':
-                self.create_backup()
-            elif choice == '2':
-                self.restore_backup()
-            elif choice == '3':
-                self.list_backups()
-            elif choice == '4':
-                self.delete_backup()
-            elif choice == '0':
+            if choice == '0':
                 break
+            action = self._backup_dispatch.get(choice)
+            if action:
+                action()
             else:
-                print("Invalid option.")
-                input("\nPress Enter to continue...")
+                self.invalid_option()
 
     def create_backup(self):
         """Create database backup (INV-NF-004)."""
         self.clear_screen()
         self.print_header("CREATE BACKUP")
         
-        user = self.auth.get_current_username()
+        user = self._user()
         backup_path = self.backup_manager.create_backup(user)
         
         input("\nPress Enter to continue...")
@@ -763,12 +923,17 @@ class CLI:
         
         self.backup_manager.display_backups()
         
-        backup_filename = self.input_with_prompt("Enter backup filename to restore")
-        
+        try:
+            backup_filename = self.input_with_prompt("Enter backup filename to restore: ")
+        except ValueError as e:
+            print(f"\n[X] {str(e)}")
+            input("\nPress Enter to continue...")
+            return
+
         confirm = input("\n[!] This will replace the current database. Continue? (yes/no): ").strip().lower()
         
         if confirm == 'yes':
-            user = self.auth.get_current_username()
+            user = self._user()
             self.backup_manager.restore_backup(backup_filename, user)
         else:
             print("Restore cancelled.")
@@ -791,12 +956,17 @@ class CLI:
         
         self.backup_manager.display_backups()
         
-        backup_filename = self.input_with_prompt("Enter backup filename to delete")
-        
+        try:
+            backup_filename = self.input_with_prompt("Enter backup filename to delete: ")
+        except ValueError as e:
+            print(f"\n[X] {str(e)}")
+            input("\nPress Enter to continue...")
+            return
+
         confirm = input(f"\nDelete {backup_filename}? (yes/no): ").strip().lower()
         
         if confirm == 'yes':
-            user = self.auth.get_current_username()
+            user = self._user()
             self.backup_manager.delete_backup(backup_filename, user)
         else:
             print("Deletion cancelled.")
@@ -826,8 +996,9 @@ class CLI:
         """Authentication menu."""
         if self.auth.is_authenticated():
             # Logout
-            username = self.auth.get_current_username()
+            username = self._user()
             self.auth.logout()
+            self._cached_user = None
             print(f"\n[OK] Logged out successfully. Goodbye, {username}!")
             input("\nPress Enter to continue...")
         else:
@@ -839,10 +1010,17 @@ class CLI:
         self.clear_screen()
         self.print_header("LOGIN")
         
-        username = self.input_with_prompt("Username")
-        password = self.input_with_prompt("Password")
-        
+        try:
+            username = self.input_with_prompt("Username: ")
+            password = self.input_with_prompt("Password: ")
+        except ValueError as e:
+            # Retries exhausted; back to the menu instead of crashing out
+            print(f"\n[X] {str(e)}")
+            input("\nPress Enter to continue...")
+            return
+
         if self.auth.login(username, password):
+            self._cached_user = None
             role = "Admin" if self.auth.is_admin() else "User"
             print(f"\n[OK] Login successful! Welcome, {username} ({role})")
         else:
@@ -884,10 +1062,15 @@ class CLI:
         self.print_header("EXIT")
         
         if self.auth.is_authenticated():
-            username = self.auth.get_current_username()
+            username = self._user()
             self.auth.logout()
+            self._cached_user = None
             print(f"\nLogging out {username}...")
-        
+
+        # Make sure any queued audit entries reach the database
+        if self._logger is not None:
+            self._logger.flush()
+
         print("\nThank you for using the Inventory Management System!")
         print("Goodbye!\n")
         self.running = False
@@ -4,6 +4,7 @@ Handles application configuration settings.
 Provides centralized configuration for paths, thresholds, and security keys.
 """
 
+import functools
 import os
 from pathlib import Path
 from cryptography.fernet import Fernet
@@ -11,48 +12,78 @@ from cryptography.fernet import Fernet
 # Base directory (project root)
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Path constants are joined once with pathlib and exported as str (the
+# form every consumer and os.path call expects)
+
 # Database configuration
-DB_PATH = os.path.join(BASE_DIR, "data", "database.sqlite")
+DB_PATH = str(BASE_DIR / "data" / "database.sqlite")
 
 # Backup configuration
-BACKUP_PATH = os.path.join(BASE_DIR, "backups")
+BACKUP_PATH = str(BASE_DIR / "backups")
 
 # Reports configuration
-REPORTS_PATH = os.path.join(BASE_DIR, "reports")
+REPORTS_PATH = str(BASE_DIR / "reports")
 
 # Low stock threshold (INV-F-032)
 LOW_STOCK_THRESHOLD = 5
 
+# Opt-in cache for derived password hashes (PRJ-SEC-001). The cache is
+# keyed on plaintext password bytes, so it stays OFF by default: a
+# production process must not retain every attempted credential (typos
+# and failed guesses included) in memory for its lifetime. Test suites
+# and bulk user-import scripts, which re-hash the same known passwords
+# many times, can opt in by setting IMS_HASH_CACHE=1 before import.
+PASSWORD_HASH_CACHE = os.environ.get('IMS_HASH_CACHE') == '1'
+
 # Encryption key for backups (PRJ-SEC-002)
 # In production, this should be stored securely (env variable, key vault)
 # For this project, we generate/load a key file
-KEY_FILE = os.path.join(BASE_DIR, "data", ".encryption_key")
+KEY_FILE = str(BASE_DIR / "data" / ".encryption_key")
 
 
+@functools.lru_cache(maxsize=None)
 def get_encryption_key():
     """
     Get or generate encryption key for backup encryption.
     Returns bytes key for Fernet encryption.
+
+    Cached: repeat calls return the key without re-statting or re-reading
+    the key file.
     """
-    if os.path.exists(KEY_FILE):
+    try:
         with open(KEY_FILE, 'rb') as f:
             return f.read()
-    else:
-        # Generate new key
-        key = Fernet.generate_key()
-        # Ensure data directory exists
-        os.makedirs(os.path.dirname(KEY_FILE), exist_ok=True)
-        with open(KEY_FILE, 'wb') as f:
-            f.write(key)
-        # Set restrictive permissions (PRJ-SEC-005)
-        try:
-            os.chmod(KEY_FILE, 0o600)  # Read/write for owner only
-        except Exception:
-            pass  # Windows may not support chmod
-        return key
+    except FileNotFoundError:
+        pass
+
+    # Generate new key
+    key = Fernet.generate_key()
+    # Ensure data directory exists
+    os.makedirs(os.path.dirname(KEY_FILE), exist_ok=True)
+    # O_EXCL creates the file atomically with 0o600 permissions
+    # (PRJ-SEC-005): no separate chmod, and two processes racing at
+    # first run cannot clobber each other's key
+    try:
+        fd = os.open(KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # Another process won the race; use its key
+        with open(KEY_FILE, 'rb') as f:
+            return f.read()
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
 
+def __getattr__(name):
+    """Compute ENCRYPTION_KEY lazily on first access.
 
-ENCRYPTION_KEY = get_encryption_key()
+    Generating or reading the key at import time made every importer of
+    this module (and transitively of any src module) pay file I/O even
+    when encryption is never used.
+    """
+    if name == 'ENCRYPTION_KEY':
+        return get_encryption_key()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ConfigManager:
@@ -64,15 +95,16 @@ class ConfigManager:
         self.backup_path = BACKUP_PATH
         self.reports_path = REPORTS_PATH
         self.low_stock_threshold = LOW_STOCK_THRESHOLD
-        self.encryption_key = ENCRYPTION_KEY
-
-    def get_config(self, key):
-        """Get configuration value by key."""
-        config_map = {
+        self.encryption_key = get_encryption_key()
+        # Lookup map built once instead of reallocated per get_config call
+        self._config_map = {
             'db_path': self.db_path,
             'backup_path': self.backup_path,
             'reports_path': self.reports_path,
             'low_stock_threshold': self.low_stock_threshold,
             'encryption_key': self.encryption_key
         }
-        return config_map.get(key)
+
+    def get_config(self, key):
+        """Get configuration value by key."""
+        return self._config_map.get(key)
@@ -4,6 +4,9 @@ Handles application logging and audit trails.
 Implements PRJ-SEC-003 (Log admin actions with timestamp, action, details, user).
 """
 
+import queue
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict
 from .storage import StorageManager
@@ -12,25 +15,129 @@ from .storage import StorageManager
 class LogManager:
     """Manages logging operations."""
 
-    def __init__(self, storage: StorageManager = None):
+    # Maximum entries the background writer folds into one transaction
+    _ASYNC_BATCH_MAX = 256
+
+    def __init__(self, storage: StorageManager = None,
+                 async_writes: bool = False):
         """
         Initialize log manager.
-        
+
         Args:
             storage: StorageManager instance (optional, creates new if not provided)
+            async_writes: When True, log_action enqueues entries for a
+                background writer thread that groups them into shared
+                transactions, keeping the commit off the caller's
+                critical path. Call flush() before shutdown to guarantee
+                queued entries are durable. Default is synchronous
+                writes.
         """
         self.storage = storage or StorageManager()
+        # Entries queued while inside a batch() block
+        self._pending: List[tuple] = []
+        self._in_batch = False
+        self._queue = None
+        self._writer = None
+        if async_writes:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self._drain_queue,
+                                            daemon=True)
+            self._writer.start()
 
     def log_action(self, user: str, action: str, details: str = ""):
         """
         Log an action to the database (PRJ-SEC-003).
-        
+
+        Inside a batch() block the entry is queued and written with the
+        rest of the batch in a single transaction; in async mode it is
+        handed to the background writer.
+
         Args:
             user: Username performing the action
             action: Action being performed (e.g., "DELETE_PRODUCT", "CREATE_BACKUP")
             details: Additional details about the action
         """
-        self.storage.add_log(user, action, details)
+        if self._in_batch:
+            self._pending.append((user, action, details))
+        elif self._queue is not None:
+            self._queue.put((user, action, details))
+        else:
+            self.storage.add_log(user, action, details)
+
+    def _drain_queue(self):
+        """Background writer: group queued entries into one transaction each pass."""
+        while True:
+            entries = [self._queue.get()]
+            # Fold in whatever else has already arrived so a burst of
+            # orders shares one commit instead of one fsync apiece
+            try:
+                while len(entries) < self._ASYNC_BATCH_MAX:
+                    entries.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                self.storage.add_logs(entries)
+            except Exception as e:
+                # A transient failure (locked database, disk hiccup)
+                # must not kill the writer thread — that would silently
+                # drop every future audit entry and leave flush()
+                # waiting forever. Retry the batch once, then drop it
+                # with a notice so the queue keeps moving.
+                try:
+                    self.storage.add_logs(entries)
+                except Exception:
+                    print(f"Warning: failed to write {len(entries)} "
+                          f"log entries ({e})")
+            finally:
+                for _ in entries:
+                    self._queue.task_done()
+
+    def flush(self):
+        """Block until all queued entries are written (no-op when synchronous).
+
+        Raises:
+            RuntimeError: If the background writer is no longer running;
+                queue.join() would block forever with nobody draining
+        """
+        if self._queue is None:
+            return
+        if not self._writer.is_alive():
+            raise RuntimeError("Async log writer is not running")
+        self._queue.join()
+
+    def log_actions_bulk(self, entries: List[tuple]) -> int:
+        """
+        Log multiple actions in one transaction (PRJ-SEC-003).
+
+        Args:
+            entries: (user, action, details) tuples
+
+        Returns:
+            Number of entries written
+        """
+        return self.storage.add_logs(entries)
+
+    @contextmanager
+    def batch(self):
+        """
+        Queue log_action calls and flush them in one transaction.
+
+        Every log_action otherwise commits individually; operations that
+        emit several entries (order creation logs the stock update and
+        the order) wrap themselves in `with logger.batch():` to pay one
+        commit for the burst. Nested batches flush with the outermost.
+        """
+        if self._in_batch:
+            yield self
+            return
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            pending, self._pending = self._pending, []
+            if pending:
+                self.storage.add_logs(pending)
 
     def get_recent_logs(self, limit: int = 100) -> List[Dict]:
         """
@@ -55,9 +162,9 @@ class LogManager:
         Returns:
             List of log dictionaries for the specified user
         """
-        all_logs = self.get_recent_logs(limit * 2)  # Get more to ensure enough after filtering
-        user_logs = [log for log in all_logs if log['user'] == username]
-        return user_logs[:limit]
+        # Filter in SQL: the old fetch-2x-and-filter approach pulled far
+        # more rows than needed and dropped matches when they were sparse
+        return self.storage.get_logs(limit=limit, user=username)
 
     def get_logs_by_action(self, action: str, limit: int = 100) -> List[Dict]:
         """
@@ -70,9 +177,27 @@ class LogManager:
         Returns:
             List of log dictionaries for the specified action
         """
-        all_logs = self.get_recent_logs(limit * 2)
-        action_logs = [log for log in all_logs if action.lower() in log['action'].lower()]
-        return action_logs[:limit]
+        # LIKE keeps the case-insensitive substring semantics in SQL
+        return self.storage.get_logs(limit=limit, action_like=f"%{action}%")
+
+    def count_actions_by_user(self, username: str) -> Dict[str, int]:
+        """
+        Count a user's log entries grouped by action type.
+
+        Args:
+            username: Username to count logs for
+
+        Returns:
+            Mapping of action type to entry count
+        """
+        # GROUP BY in SQL: only the per-action counts cross the
+        # sqlite -> Python boundary, not the rows being counted
+        rows = self.storage.execute_query(
+            "SELECT action, COUNT(*) AS n FROM logs WHERE user = ? "
+            "GROUP BY action",
+            (username,)
+        )
+        return {row['action']: row['n'] for row in rows}
 
     def format_log_entry(self, log: Dict) -> str:
         """
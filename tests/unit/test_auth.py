@@ -3,9 +3,9 @@ Unit tests for authentication module.
 Tests PRJ-SEC-001 (password hashing).
 """
 
+import inspect
+
 import pytest
-import tempfile
-import os
 from src.auth import AuthManager
 from src.storage import StorageManager
 
@@ -13,15 +13,6 @@ from src.storage import StorageManager
 class TestAuthManager:
     """Test authentication manager."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
     @pytest.fixture
     def auth_manager(self, temp_db):
         """Create auth manager with temporary database."""
@@ -46,6 +37,14 @@ class TestAuthManager:
         
         assert hash1 == hash2
 
+    def test_hash_passwords_bulk(self, auth_manager):
+        """Test bulk hashing matches per-password hashing."""
+        passwords = ["test123", "other456", "third789"]
+        hashes = auth_manager.hash_passwords_bulk(passwords)
+
+        assert len(hashes) == 3
+        assert hashes == [auth_manager.hash_password(p) for p in passwords]
+
     def test_verify_password_correct(self, auth_manager):
         """Test password verification with correct password."""
         password = "test123"
@@ -61,6 +60,14 @@ class TestAuthManager:
         
         assert auth_manager.verify_password(wrong_password, hashed) is False
 
+    def test_verify_password_constant_time(self, auth_manager):
+        """Test verification compares digests in constant time (PRJ-SEC-001)."""
+        # Guard against a regression to ==, which leaks a timing side
+        # channel on the matched prefix length
+        source = inspect.getsource(auth_manager.verify_password)
+        assert "compare_digest" in source
+        assert " == " not in source
+
     def test_login_success(self, auth_manager):
         """Test successful login with admin credentials."""
         # Default admin user: username=admin, password=admin123
@@ -4,9 +4,7 @@ Tests PRJ-SEC-002, PRJ-SEC-005, INV-NF-004.
 """
 
 import pytest
-import tempfile
 import os
-import shutil
 from src.backup_security import BackupManager, SecurityManager
 from src.storage import StorageManager
 from src.logger import LogManager
@@ -17,36 +15,28 @@ class TestBackupManager:
     """Test backup manager."""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
-
-    @pytest.fixture
-    def temp_db(self, temp_dir):
+    def temp_db(self, tmp_path):
         """Create temporary database for testing."""
-        db_path = os.path.join(temp_dir, 'test.db')
+        db_path = str(tmp_path / 'test.db')
         storage = StorageManager(db_path)
         # Add some data
         storage.add_product("TEST001", "Product", 10.00, "Cat", 50)
         return db_path
 
     @pytest.fixture
-    def backup_manager(self, temp_dir, temp_db):
+    def backup_manager(self, tmp_path, temp_db):
         """Create backup manager with temporary paths."""
-        backup_dir = os.path.join(temp_dir, 'backups')
-        os.makedirs(backup_dir, exist_ok=True)
-        
+        backup_dir = tmp_path / 'backups'
+        backup_dir.mkdir()
+
         storage = StorageManager(temp_db)
         logger = LogManager(storage)
         bm = BackupManager(logger)
-        
+
         # Override paths for testing
-        bm.backup_dir = backup_dir
+        bm.backup_dir = str(backup_dir)
         bm.db_path = temp_db
-        
+
         return bm
 
     def test_create_backup_success(self, backup_manager):
@@ -97,6 +87,39 @@ class TestBackupManager:
         
         assert success is True
 
+    def test_restore_backup_discards_later_changes(self, backup_manager, temp_db):
+        """Test restoring actually rewinds to the backed-up content."""
+        backup_path = backup_manager.create_backup("admin")
+        backup_filename = os.path.basename(backup_path)
+
+        # Change the database after the backup was taken
+        with StorageManager(temp_db, seed_admin=False) as storage:
+            storage.add_product("NEW001", "Post-Backup Product", 20.00, "Cat", 100)
+
+        assert backup_manager.restore_backup(backup_filename, "admin") is True
+
+        # A fresh manager must see the backed-up row but not the later
+        # one — stale WAL sidecars would resurrect it
+        with StorageManager(temp_db, seed_admin=False) as restored:
+            assert restored.get_product_by_sku("TEST001") is not None
+            assert restored.get_product_by_sku("NEW001") is None
+
+    def test_restore_backup_refreshes_live_connections(self, backup_manager):
+        """Test a live StorageManager sees restored data without reopening."""
+        storage = backup_manager.logger.storage
+        backup_path = backup_manager.create_backup("admin")
+        backup_filename = os.path.basename(backup_path)
+
+        storage.add_product("NEW001", "Post-Backup Product", 20.00, "Cat", 100)
+        assert storage.get_product_by_sku("NEW001") is not None
+
+        assert backup_manager.restore_backup(backup_filename, "admin") is True
+
+        # Same instance, no reopen: its cached connection must not keep
+        # serving the replaced file
+        assert storage.get_product_by_sku("NEW001") is None
+        assert storage.get_product_by_sku("TEST001") is not None
+
     def test_restore_backup_nonexistent(self, backup_manager):
         """Test restoring from non-existent backup fails."""
         success = backup_manager.restore_backup("nonexistent.enc", "admin")
@@ -125,11 +148,23 @@ class TestBackupManager:
 class TestSecurityManager:
     """Test security manager."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def security_manager(self):
-        """Create security manager."""
+        """Create security manager once for the module.
+
+        No test mutates it — they only run encrypt/decrypt/verify — so
+        the key material and cipher setup are paid a single time.
+        """
         return SecurityManager()
 
+    def test_backend_is_openssl(self):
+        """Test encryption runs on the C-accelerated OpenSSL backend."""
+        from cryptography.hazmat.backends import default_backend
+
+        # A pure-Python fallback would be orders of magnitude slower
+        # and would miss AES-NI entirely
+        assert default_backend().name == "openssl"
+
     def test_encrypt_data(self, security_manager):
         """Test encrypting data (PRJ-SEC-002)."""
         original_data = b"This is sensitive data"
@@ -159,20 +194,19 @@ class TestSecurityManager:
             decrypted = security_manager.decrypt_data(encrypted)
             assert decrypted == test_data
 
-    def test_verify_backup_integrity_valid(self, security_manager, tmp_path):
+    def test_verify_backup_integrity_valid(self, security_manager):
         """Test verifying valid backup integrity."""
-        # Create encrypted backup file
-        test_data = b"Backup data"
-        encrypted = security_manager.encrypt_data(test_data)
-        
-        backup_path = tmp_path / 'test_backup.enc'
-        backup_path.write_bytes(encrypted)
-        
-        # Verify integrity
-        is_valid = security_manager.verify_backup_integrity(str(backup_path))
-        
+        # Verify the encrypted payload in memory — no file round-trip
+        encrypted = security_manager.encrypt_data(b"Backup data")
+
+        is_valid = security_manager.verify_backup_integrity(encrypted)
+
         assert is_valid is True
 
+    def test_verify_backup_integrity_invalid_bytes(self, security_manager):
+        """Test verifying corrupted bytes fails."""
+        assert security_manager.verify_backup_integrity(b"garbage") is False
+
     def test_verify_backup_integrity_invalid(self, security_manager, tmp_path):
         """Test verifying corrupted backup fails."""
         # Create invalid backup file
@@ -183,3 +217,16 @@ class TestSecurityManager:
         is_valid = security_manager.verify_backup_integrity(str(backup_path))
         
         assert is_valid is False
+
+    def test_verify_backups_bulk(self, security_manager, tmp_path):
+        """Test concurrent integrity sweep over multiple backups."""
+        valid_path = tmp_path / 'valid_backup.enc'
+        valid_path.write_bytes(security_manager.encrypt_data(b"Backup data"))
+
+        corrupt_path = tmp_path / 'corrupt_backup.enc'
+        corrupt_path.write_bytes(b"This is not encrypted data")
+
+        results = security_manager.verify_backups([str(valid_path), str(corrupt_path)])
+
+        assert results[str(valid_path)] is True
+        assert results[str(corrupt_path)] is False
@@ -4,8 +4,8 @@ Tests PRJ-SEC-003 (logging admin actions).
 """
 
 import pytest
-import tempfile
-import os
+import sqlite3
+import threading
 from src.logger import LogManager
 from src.storage import StorageManager
 
@@ -13,15 +13,6 @@ from src.storage import StorageManager
 class TestLogManager:
     """Test log manager."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
     @pytest.fixture
     def log_manager(self, temp_db):
         """Create log manager with temporary database."""
@@ -51,9 +42,10 @@ class TestLogManager:
 
     def test_get_recent_logs(self, log_manager):
         """Test getting recent logs."""
-        # Create multiple log entries
-        for i in range(5):
-            log_manager.log_action(f"user{i}", f"ACTION_{i}", f"Details {i}")
+        # Create multiple log entries in one batched insert
+        with log_manager.batch():
+            for i in range(5):
+                log_manager.log_action(f"user{i}", f"ACTION_{i}", f"Details {i}")
         
         logs = log_manager.get_recent_logs(3)
         
@@ -61,9 +53,10 @@ class TestLogManager:
 
     def test_get_recent_logs_limit(self, log_manager):
         """Test that limit parameter works correctly."""
-        # Create 10 logs
-        for i in range(10):
-            log_manager.log_action("user", f"ACTION_{i}", f"Details {i}")
+        # Create 10 logs in one batched insert
+        with log_manager.batch():
+            for i in range(10):
+                log_manager.log_action("user", f"ACTION_{i}", f"Details {i}")
         
         # Get only 5
         logs = log_manager.get_recent_logs(5)
@@ -125,14 +118,12 @@ class TestLogManager:
 
     def test_log_ordering(self, log_manager):
         """Test that logs are returned in reverse chronological order."""
-        import time
-        
+        # No sleeps needed: get_logs orders on rowid, so insertion
+        # order is preserved even for same-millisecond timestamps
         log_manager.log_action("user", "ACTION_1", "First")
-        time.sleep(0.01)  # Small delay to ensure different timestamps
         log_manager.log_action("user", "ACTION_2", "Second")
-        time.sleep(0.01)
         log_manager.log_action("user", "ACTION_3", "Third")
-        
+
         logs = log_manager.get_recent_logs(10)
         
         # Most recent should be first
@@ -142,9 +133,11 @@ class TestLogManager:
 
     def test_log_multiple_users(self, log_manager):
         """Test logging actions from multiple users."""
-        log_manager.log_action("admin", "ADMIN_ACTION", "Admin activity")
-        log_manager.log_action("user1", "USER_ACTION", "User 1 activity")
-        log_manager.log_action("user2", "USER_ACTION", "User 2 activity")
+        log_manager.log_actions_bulk([
+            ("admin", "ADMIN_ACTION", "Admin activity"),
+            ("user1", "USER_ACTION", "User 1 activity"),
+            ("user2", "USER_ACTION", "User 2 activity"),
+        ])
         
         logs = log_manager.get_recent_logs(10)
         
@@ -152,3 +145,91 @@ class TestLogManager:
         assert 'admin' in users
         assert 'user1' in users
         assert 'user2' in users
+
+    def test_count_actions_by_user(self, log_manager):
+        """Test per-user action counts grouped in SQL."""
+        log_manager.log_action("admin", "ADD_PRODUCT", "First")
+        log_manager.log_action("admin", "ADD_PRODUCT", "Second")
+        log_manager.log_action("admin", "DELETE_PRODUCT", "Third")
+        log_manager.log_action("user1", "ADD_PRODUCT", "Other user")
+
+        counts = log_manager.count_actions_by_user("admin")
+
+        assert counts["ADD_PRODUCT"] == 2
+        assert counts["DELETE_PRODUCT"] == 1
+        assert "LOGIN" not in counts
+
+    def test_log_actions_bulk(self, log_manager):
+        """Test writing multiple log entries in one call."""
+        entries = [
+            ("admin", "BULK_ACTION_1", "First"),
+            ("admin", "BULK_ACTION_2", "Second"),
+            ("user1", "BULK_ACTION_3", "Third"),
+        ]
+        written = log_manager.log_actions_bulk(entries)
+
+        assert written == 3
+        logs = log_manager.get_recent_logs(10)
+        actions = set(log['action'] for log in logs)
+        assert {"BULK_ACTION_1", "BULK_ACTION_2", "BULK_ACTION_3"} <= actions
+
+    def test_batch_context_flushes_on_exit(self, log_manager):
+        """Test that batched log entries are written when the block exits."""
+        with log_manager.batch():
+            log_manager.log_action("admin", "BATCHED_1", "One")
+            log_manager.log_action("admin", "BATCHED_2", "Two")
+
+        logs = log_manager.get_recent_logs(10)
+        actions = set(log['action'] for log in logs)
+        assert {"BATCHED_1", "BATCHED_2"} <= actions
+
+    def test_async_writes_flush(self, temp_db):
+        """Test async log writes are durable after flush()."""
+        storage = StorageManager(temp_db)
+        log_manager = LogManager(storage, async_writes=True)
+
+        log_manager.log_action("admin", "ASYNC_1", "One")
+        log_manager.log_action("admin", "ASYNC_2", "Two")
+        log_manager.flush()
+
+        logs = log_manager.get_recent_logs(10)
+        actions = set(log['action'] for log in logs)
+        assert {"ASYNC_1", "ASYNC_2"} <= actions
+
+    def test_async_writer_survives_write_failure(self, temp_db):
+        """Test a failing batch doesn't kill the background writer."""
+        storage = StorageManager(temp_db)
+        log_manager = LogManager(storage, async_writes=True)
+
+        real_add_logs = storage.add_logs
+
+        def failing_add_logs(entries):
+            if any(entry[1] == "POISON" for entry in entries):
+                raise sqlite3.OperationalError("database is locked")
+            return real_add_logs(entries)
+
+        storage.add_logs = failing_add_logs
+
+        log_manager.log_action("admin", "POISON", "Never written")
+        # Must return (batch dropped after retry) rather than hang
+        log_manager.flush()
+
+        log_manager.log_action("admin", "AFTER_FAILURE", "Still written")
+        log_manager.flush()
+
+        actions = set(log['action'] for log in log_manager.get_recent_logs(10))
+        assert "AFTER_FAILURE" in actions
+
+    def test_flush_fails_when_writer_dead(self, temp_db):
+        """Test flush() raises instead of hanging if the writer is gone."""
+        storage = StorageManager(temp_db)
+        log_manager = LogManager(storage, async_writes=True)
+
+        dead = threading.Thread(target=lambda: None)
+        dead.start()
+        dead.join()
+        log_manager._writer = dead
+
+        log_manager.log_action("admin", "ORPHANED", "Nobody draining")
+        with pytest.raises(RuntimeError):
+            log_manager.flush()
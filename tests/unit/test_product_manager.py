@@ -4,25 +4,24 @@ Tests INV-F-001, INV-F-002, INV-F-003, INV-F-032.
 """
 
 import pytest
-import tempfile
-import os
 from src.product_manager import ProductManager
 from src.storage import StorageManager
 from src.logger import LogManager
 
 
+# Canonical rows shared by the read-only search/low-stock tests
+CATALOG = [
+    ("LAPTOP001", "Gaming Laptop", 1299.99, "Electronics", 10, None),
+    ("LAPTOP002", "Business Laptop", 999.99, "Electronics", 15, None),
+    ("CHAIR001", "Office Chair", 199.99, "Furniture", 20, None),
+    ("LOW001", "Low Stock Item", 10.00, "Cat", 2, None),
+    ("GOOD001", "Good Stock Item", 20.00, "Cat", 100, None),
+]
+
+
 class TestProductManager:
     """Test product manager."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
     @pytest.fixture
     def product_manager(self, temp_db):
         """Create product manager with temporary database."""
@@ -30,6 +29,12 @@ class TestProductManager:
         logger = LogManager(storage)
         return ProductManager(storage, logger)
 
+    @pytest.fixture
+    def catalog(self, product_manager):
+        """Product manager with the canonical catalog seeded in bulk."""
+        product_manager.add_products_bulk(CATALOG)
+        return product_manager
+
     def test_add_product_success(self, product_manager):
         """Test adding product successfully (INV-F-001)."""
         product_id = product_manager.add_product(
@@ -53,15 +58,35 @@ class TestProductManager:
         
         assert result is None
 
-    def test_add_product_negative_price(self, product_manager):
-        """Test adding product with negative price raises error."""
+    @pytest.mark.parametrize("price,stock", [
+        (-10.00, 10),
+        (10.00, -5),
+    ], ids=["negative_price", "negative_stock"])
+    def test_add_product_invalid(self, product_manager, price, stock):
+        """Test adding product with negative price or stock raises error."""
         with pytest.raises(ValueError):
-            product_manager.add_product("TEST001", "Test", -10.00, "Cat", 10)
+            product_manager.add_product("TEST001", "Test", price, "Cat", stock)
+
+    def test_add_products_bulk(self, product_manager):
+        """Test bulk product insert skips existing SKUs."""
+        product_manager.add_product("BULK001", "Existing", 9.99, "Cat", 5)
 
-    def test_add_product_negative_stock(self, product_manager):
-        """Test adding product with negative stock raises error."""
+        inserted = product_manager.add_products_bulk([
+            ("BULK001", "Duplicate", 9.99, "Cat", 5, ""),
+            ("BULK002", "New One", 19.99, "Cat", 10, ""),
+            ("BULK003", "New Two", 29.99, "Cat", 15, ""),
+        ])
+
+        assert inserted == 2
+        assert product_manager.storage.get_product_by_sku("BULK002") is not None
+        assert product_manager.storage.get_product_by_sku("BULK003") is not None
+
+    def test_add_products_bulk_negative_price(self, product_manager):
+        """Test bulk insert rejects negative prices before writing."""
         with pytest.raises(ValueError):
-            product_manager.add_product("TEST001", "Test", 10.00, "Cat", -5)
+            product_manager.add_products_bulk([
+                ("BULK010", "Bad", -1.00, "Cat", 5, ""),
+            ])
 
     def test_get_all_products(self, product_manager):
         """Test getting all products (INV-F-002)."""
@@ -82,18 +107,14 @@ class TestProductManager:
         assert product['sku'] == "PROD001"
         assert product['name'] == "Product 1"
 
-    def test_search_products(self, product_manager):
+    def test_search_products(self, catalog):
         """Test searching products (INV-F-002)."""
-        product_manager.add_product("LAPTOP001", "Gaming Laptop", 1299.99, "Electronics", 10)
-        product_manager.add_product("LAPTOP002", "Business Laptop", 999.99, "Electronics", 15)
-        product_manager.add_product("CHAIR001", "Office Chair", 199.99, "Furniture", 20)
-        
         # Search by keyword
-        results = product_manager.search_products("Laptop")
+        results = catalog.search_products("Laptop")
         assert len(results) == 2
-        
+
         # Search by category
-        results = product_manager.search_products("Electronics")
+        results = catalog.search_products("Electronics")
         assert len(results) == 2
 
     def test_update_product_success(self, product_manager):
@@ -144,12 +165,9 @@ class TestProductManager:
         
         assert success is False
 
-    def test_get_low_stock_products(self, product_manager):
+    def test_get_low_stock_products(self, catalog):
         """Test getting low stock products (INV-F-032)."""
-        product_manager.add_product("LOW001", "Low Stock Item", 10.00, "Cat", 2)
-        product_manager.add_product("GOOD001", "Good Stock Item", 20.00, "Cat", 100)
-        
-        low_stock = product_manager.get_low_stock_products(threshold=5)
+        low_stock = catalog.get_low_stock_products(threshold=5)
         
         assert len(low_stock) >= 1
         assert all(p['stock'] <= 5 for p in low_stock)
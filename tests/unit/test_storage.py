@@ -4,23 +4,13 @@ Tests database operations and persistence (INV-NF-002).
 """
 
 import pytest
-import tempfile
-import os
+import sqlite3
 from src.storage import StorageManager
 
 
 class TestStorageManager:
     """Test storage manager."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
     @pytest.fixture
     def storage(self, temp_db):
         """Create storage manager with temporary database."""
@@ -110,6 +100,74 @@ class TestStorageManager:
         results = storage.search_products("Electronics")
         assert len(results) == 2
 
+    def test_count_matching(self, storage):
+        """Test count-only search companions agree with the row search."""
+        storage.add_product("TEST001", "Laptop Computer", 999.99, "Electronics", 10)
+        storage.add_product("TEST002", "Desktop Computer", 799.99, "Electronics", 5)
+        storage.add_product("TEST003", "Office Chair", 199.99, "Furniture", 20)
+        storage.add_supplier("Tech Supplies Inc", "John", "john@tech.com")
+        storage.add_supplier("Tech Parts Ltd", "Jane", "jane@parts.com")
+
+        assert storage.count_products_matching("Computer") == 2
+        assert storage.count_products_matching("Computer") == \
+            len(storage.search_products("Computer"))
+        assert storage.count_suppliers_matching("Tech") == 2
+        assert storage.count_products_matching("nonexistent") == 0
+
+    def test_search_finds_rows_predating_fts(self, tmp_path):
+        """Test the FTS backfill covers rows older than the FTS tables."""
+        db_path = str(tmp_path / 'legacy.db')
+        with StorageManager(db_path, seed_admin=False):
+            pass
+
+        # Rebuild the pre-FTS state: drop the virtual tables and their
+        # triggers, then insert rows the way a legacy database holds them
+        conn = sqlite3.connect(db_path)
+        with conn:
+            for trigger in ('products_fts_ai', 'products_fts_ad',
+                            'products_fts_au', 'suppliers_fts_ai',
+                            'suppliers_fts_ad', 'suppliers_fts_au'):
+                conn.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+            conn.execute('DROP TABLE IF EXISTS products_fts')
+            conn.execute('DROP TABLE IF EXISTS suppliers_fts')
+            conn.execute(
+                "INSERT INTO products (sku, name, price, category, stock) "
+                "VALUES ('LEG001', 'Legacy Laptop', 999.00, 'Electronics', 5)")
+            conn.execute(
+                "INSERT INTO suppliers (name, contact_person, email) "
+                "VALUES ('Legacy Supplies', 'Ann', 'ann@legacy.com')")
+        conn.close()
+
+        # Reopening runs the FTS upgrade; the old rows must be searchable
+        with StorageManager(db_path, seed_admin=False) as upgraded:
+            products = upgraded.search_products("Laptop")
+            assert any(p['sku'] == 'LEG001' for p in products)
+            assert upgraded.count_products_matching("Laptop") == 1
+            suppliers = upgraded.search_suppliers("Legacy")
+            assert any(s['name'] == 'Legacy Supplies' for s in suppliers)
+
+    def test_get_products_page(self, storage):
+        """Test keyset pagination over products (INV-F-002)."""
+        for i in range(5):
+            storage.add_product(f"TEST{i:03d}", f"Product {i}", 10.00, "Cat", 5)
+
+        first = storage.get_products_page(limit=2)
+        assert [p['sku'] for p in first] == ["TEST000", "TEST001"]
+
+        second = storage.get_products_page(limit=2, after_id=first[-1]['id'])
+        assert [p['sku'] for p in second] == ["TEST002", "TEST003"]
+
+        # Walking pages to the end covers every row exactly once
+        seen = []
+        after_id = 0
+        while True:
+            page = storage.get_products_page(limit=2, after_id=after_id)
+            if not page:
+                break
+            seen.extend(p['sku'] for p in page)
+            after_id = page[-1]['id']
+        assert seen == [f"TEST{i:03d}" for i in range(5)]
+
     def test_update_product(self, storage):
         """Test updating product (INV-F-003)."""
         product_id = storage.add_product("TEST001", "Old Name", 10.00, "Cat1", 50)
@@ -183,6 +241,19 @@ class TestStorageManager:
         assert order_id is not None
         assert order_id > 0
 
+    def test_create_sales_orders_bulk(self, storage):
+        """Test bulk sales order insert (INV-F-010)."""
+        product_id = storage.add_product("TEST001", "Product", 10.00, "Cat", 100)
+
+        inserted = storage.create_sales_orders([
+            (product_id, 1, 10.00),
+            (product_id, 2, 20.00),
+            (product_id, 3, 30.00),
+        ])
+
+        assert inserted == 3
+        assert len(storage.get_sales_orders()) >= 3
+
     def test_get_sales_orders(self, storage):
         """Test getting sales orders (INV-F-031)."""
         product_id = storage.add_product("TEST001", "Product", 10.00, "Cat", 100)
@@ -4,8 +4,6 @@ Tests INV-F-020, INV-F-021.
 """
 
 import pytest
-import tempfile
-import os
 from src.supplier_manager import SupplierManager
 from src.storage import StorageManager
 from src.logger import LogManager
@@ -14,15 +12,6 @@ from src.logger import LogManager
 class TestSupplierManager:
     """Test supplier manager."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        fd, path = tempfile.mkstemp(suffix='.sqlite')
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.unlink(path)
-
     @pytest.fixture
     def supplier_manager(self, temp_db):
         """Create supplier manager with temporary database."""
@@ -137,6 +126,18 @@ class TestSupplierManager:
         assert sorted_suppliers[0]['name'] == "Alpha Corp"
         assert sorted_suppliers[-1]['name'] == "Zebra Corp"
 
+    def test_sort_suppliers_db(self, supplier_manager):
+        """Test SQL-side supplier sorting (INV-F-021)."""
+        supplier_manager.add_supplier("Zebra Corp", "Contact", "zebra@test.com")
+        supplier_manager.add_supplier("alpha corp", "Contact", "alpha@test.com")
+        supplier_manager.add_supplier("Beta Corp", "Contact", "beta@test.com")
+
+        sorted_suppliers = supplier_manager.sort_suppliers_db(sort_by='name')
+
+        # Case-insensitive, like the Python sorter
+        assert sorted_suppliers[0]['name'] == "alpha corp"
+        assert sorted_suppliers[-1]['name'] == "Zebra Corp"
+
     def test_sort_suppliers_invalid_field(self, supplier_manager):
         """Test sorting with invalid field defaults to name."""
         supplier_manager.add_supplier("Zebra Corp", "Contact", "zebra@test.com")